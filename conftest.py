@@ -0,0 +1,80 @@
+"""
+Shared pytest fixtures for the Heptapal Agent Core test scripts.
+"""
+
+import pytest
+from sqlalchemy.orm import configure_mappers
+
+from db.connection import DatabaseConnection
+from db.models import Base
+from root_agent.config import load_config
+
+MEMORY_DB_URL = "sqlite:///:memory:"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _configured_mappers():
+    """Configure the ORM mappers up front so no test's first query pays for it."""
+    configure_mappers()
+
+
+@pytest.fixture(scope="session")
+def db_connection():
+    """One DatabaseConnection, and so one engine and pool, for the whole test session."""
+    connection = DatabaseConnection(load_config().get('database', {}))
+    if not connection.connect():
+        pytest.skip("Database connection failed")
+    yield connection
+    connection.close()
+
+
+@pytest.fixture
+def db_session(db_connection):
+    """
+    A session per test, inside one transaction that is rolled back at teardown.
+    
+    The session joins the connection's transaction in create_savepoint mode,
+    so the repositories' commit() calls only release a SAVEPOINT: each test
+    runs as a single transaction, commits nothing, and leaves no rows behind.
+    """
+    connection = db_connection.engine.connect()
+    transaction = connection.begin()
+    session = db_connection.SessionLocal(bind=connection, join_transaction_mode="create_savepoint")
+    yield session
+    session.close()
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture
+def memory_db():
+    """A fresh in-memory SQLite database with the schema created; needs no MySQL server."""
+    connection = DatabaseConnection({"url": MEMORY_DB_URL})
+    connection.connect()
+    connection.create_tables(Base)
+    yield connection
+    connection.close()
+
+
+@pytest.fixture
+def memory_reminder_tools():
+    """A ReminderTools backed by its own in-memory SQLite database."""
+    from root_agent.sub_agents.reminder_agent.tools.reminder_tools import ReminderTools
+    tools = ReminderTools({"database": {"url": MEMORY_DB_URL}})
+    tools.db_connection.create_tables(Base)
+    yield tools
+    tools.db_connection.close()
+
+
+@pytest.fixture(scope="session")
+def reminder_tools(db_connection):
+    """The agents' shared ReminderTools, built once and reused by every test."""
+    from root_agent.sub_agents.reminder_agent.agent import get_reminder_tools
+    return get_reminder_tools()
+
+
+@pytest.fixture(scope="session")
+def todo_tools(db_connection):
+    """The agents' shared TodoTools, built once and reused by every test."""
+    from root_agent.sub_agents.todo_agent.agent import get_todo_tools
+    return get_todo_tools()
@@ -18,7 +18,7 @@ CREATE TABLE IF NOT EXISTS `reminders` (
     `is_active` BOOLEAN DEFAULT TRUE,
     INDEX `idx_title` (`title`),
     INDEX `idx_remind_time` (`remind_time`),
-    INDEX `idx_is_active` (`is_active`)
+    INDEX `idx_active_cover` (`is_active`, `remind_time`, `id`, `title`)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 -- Create todos table
@@ -26,15 +26,18 @@ CREATE TABLE IF NOT EXISTS `todos` (
     `id` INT AUTO_INCREMENT PRIMARY KEY,
     `title` VARCHAR(255) NOT NULL,
     `description` TEXT,
-    `priority` ENUM('low', 'medium', 'high') DEFAULT 'medium',
-    `status` ENUM('pending', 'in_progress', 'completed') DEFAULT 'pending',
+    `priority` VARCHAR(12) NOT NULL DEFAULT 'medium',
+    `status` VARCHAR(12) NOT NULL DEFAULT 'pending',
     `due_date` DATE,
     `created_at` DATETIME DEFAULT CURRENT_TIMESTAMP,
     `completed_at` DATETIME,
     INDEX `idx_title` (`title`),
     INDEX `idx_priority` (`priority`),
-    INDEX `idx_status` (`status`),
-    INDEX `idx_due_date` (`due_date`)
+    INDEX `idx_due_date_status` (`due_date`, `status`),
+    INDEX `idx_status_due_date` (`status`, `due_date`),
+    INDEX `idx_status_priority` (`status`, `priority`),
+    CONSTRAINT `ck_todos_priority` CHECK (`priority` IN ('low', 'medium', 'high')),
+    CONSTRAINT `ck_todos_status` CHECK (`status` IN ('pending', 'in_progress', 'completed'))
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 -- Insert some sample data for testing
@@ -1,9 +1,22 @@
 """
 Database package for Heptapal Agent Core.
 Provides database connection and models for reminders and todos.
+
+Exports are resolved lazily (PEP 562) so importing the package, e.g. for
+db.init_db.load_config, does not import SQLAlchemy.
 """
 
-from .connection import DatabaseConnection
-from .models import Base, Reminder, TodoItem
+__all__ = ['DatabaseConnection', 'AsyncDatabaseConnection', 'Base', 'Reminder', 'TodoItem']
+
 
-__all__ = ['DatabaseConnection', 'Base', 'Reminder', 'TodoItem'] 
\ No newline at end of file
+def __getattr__(name):
+    if name == 'DatabaseConnection':
+        from .connection import DatabaseConnection
+        return DatabaseConnection
+    if name == 'AsyncDatabaseConnection':
+        from .async_connection import AsyncDatabaseConnection
+        return AsyncDatabaseConnection
+    if name in ('Base', 'Reminder', 'TodoItem'):
+        from . import models
+        return getattr(models, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,173 @@
+"""
+Async database connection management for Heptapal Agent Core.
+Single responsibility: Handle asyncio database connections and session management.
+
+Requires the optional async extra (the asyncmy driver and SQLAlchemy's
+asyncio support):
+    uv sync --extra async
+"""
+
+import asyncio
+import logging
+from typing import Dict, Optional
+from sqlalchemy import text
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncDatabaseConnection:
+    """
+    Async counterpart of DatabaseConnection, backed by the asyncmy driver.
+    
+    Sessions are cheap and not safe for concurrent use, so open one per
+    concurrent task; the async repositories do this per call.
+    """
+    
+    def __init__(self, config: Dict):
+        """
+        Initialize async database connection with configuration.
+        
+        Args:
+            config: Database configuration dictionary
+        """
+        self.config = config
+        self.engine: Optional[AsyncEngine] = None
+        self.SessionLocal: Optional[async_sessionmaker] = None
+        self._lock = asyncio.Lock()
+        self._url = self._build_url()
+    
+    def _build_url(self) -> URL:
+        """
+        Build asyncmy MySQL connection URL from configuration.
+        
+        As with DatabaseConnection, a 'url' setting is used as-is instead,
+        e.g. sqlite+aiosqlite:///:memory: for tests.
+        
+        Returns:
+            URL: Database connection URL
+        """
+        if 'url' in self.config:
+            return make_url(self.config['url'])
+        
+        return URL.create(
+            "mysql+asyncmy",
+            username=self.config['user'],
+            password=self.config['password'],
+            host=self.config['host'],
+            port=self.config['port'],
+            database=self.config['database'],
+            query={"charset": self.config.get('charset', 'utf8mb4')}
+        )
+    
+    def _build_engine_kwargs(self) -> Dict:
+        """
+        Build async engine and pool options; same settings as the sync engine.
+        
+        Returns:
+            dict: Keyword arguments for create_async_engine
+        """
+        if self._url.get_backend_name() == "sqlite":
+            kwargs = {
+                "connect_args": {"check_same_thread": False},
+                "query_cache_size": self.config.get('query_cache_size', 1200),
+                "echo": False
+            }
+            if self._url.database in (None, "", ":memory:"):
+                kwargs["poolclass"] = StaticPool
+            return kwargs
+        
+        return {
+            "pool_size": self.config.get('pool_size', 10),
+            "max_overflow": self.config.get('max_overflow', 20),
+            "pool_timeout": self.config.get('pool_timeout', 30),
+            "pool_use_lifo": self.config.get('pool_use_lifo', True),
+            "pool_recycle": self.config.get('pool_recycle', 1800),
+            "pool_pre_ping": self.config.get('pool_pre_ping', False),
+            "connect_args": {"connect_timeout": self.config.get('connect_timeout', 10)},
+            "query_cache_size": self.config.get('query_cache_size', 1200),
+            "echo": False
+        }
+    
+    async def connect(self) -> bool:
+        """
+        Establish database connection and create the async engine.
+        
+        Idempotent: once connected, the existing engine and its pool are reused.
+        
+        Returns:
+            bool: True if connection successful, False otherwise
+        """
+        async with self._lock:
+            if self.engine is not None:
+                return True
+            
+            engine = None
+            try:
+                engine = create_async_engine(
+                    self._url,
+                    **self._build_engine_kwargs()
+                )
+                
+                # Test connection
+                async with engine.connect() as connection:
+                    await connection.execute(text("SELECT 1"))
+                
+                # Same session options as the sync sessionmaker
+                self.SessionLocal = async_sessionmaker(
+                    autoflush=False,
+                    expire_on_commit=False,
+                    bind=engine
+                )
+                self.engine = engine
+                
+                logger.info(f"Successfully connected to database: {self._url.database}")
+                return True
+            
+            except SQLAlchemyError as e:
+                if engine is not None:
+                    await engine.dispose()
+                logger.error(f"Failed to connect to database: {str(e)}")
+                return False
+    
+    async def get_session(self) -> Optional[AsyncSession]:
+        """
+        Get a new async database session.
+        
+        Returns:
+            AsyncSession: Database session or None if connection failed
+        """
+        if not self.SessionLocal:
+            if not await self.connect():
+                return None
+        
+        return self.SessionLocal()
+    
+    async def create_tables(self, base):
+        """
+        Create all tables defined in the base.
+        
+        Args:
+            base: SQLAlchemy declarative base
+        """
+        try:
+            async with self.engine.begin() as connection:
+                await connection.run_sync(base.metadata.create_all)
+            logger.info("Database tables created successfully")
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to create tables: {str(e)}")
+            raise
+    
+    async def close(self):
+        """
+        Close database connection and dispose engine.
+        """
+        async with self._lock:
+            if self.engine:
+                await self.engine.dispose()
+                self.engine = None
+                self.SessionLocal = None
+                logger.info("Database connection closed")
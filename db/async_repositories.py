@@ -0,0 +1,201 @@
+"""
+Async database repositories for Heptapal Agent Core.
+Single responsibility: Expose the reminder and todo repositories to asyncio code.
+
+Each call opens its own AsyncSession and runs the sync repository method
+through AsyncSession.run_sync, so the queries and result handling stay in
+repositories.py while the I/O is awaited. Because sessions are per call,
+independent operations can be overlapped, e.g.:
+
+    reminders, todos = await asyncio.gather(
+        reminder_repository.list_reminders(),
+        todo_repository.list_todos()
+    )
+"""
+
+from typing import Callable, Dict, List, Optional
+from datetime import date, datetime
+
+from .async_connection import AsyncDatabaseConnection
+from .repositories import ReminderRepository, TodoRepository
+
+
+async def _run(db_connection: AsyncDatabaseConnection, operation: Callable) -> Dict:
+    """
+    Run a sync repository operation on a fresh async session.
+    
+    Args:
+        db_connection: Async connection providing sessions
+        operation: Callable taking a sync Session and returning the result dict
+    
+    Returns:
+        dict: The operation's result, or an error if no session is available
+    """
+    session = await db_connection.get_session()
+    if not session:
+        return {
+            "status": "error",
+            "message": "Database connection failed"
+        }
+    
+    async with session:
+        return await session.run_sync(operation)
+
+
+class AsyncReminderRepository:
+    """
+    Async repository for reminder database operations.
+    Single responsibility: Run ReminderRepository operations without blocking the event loop.
+    """
+    
+    def __init__(self, db_connection: AsyncDatabaseConnection):
+        self.db_connection = db_connection
+    
+    async def add_reminder(self, title: str, description: str, remind_time: datetime) -> Dict:
+        """Add a new reminder to the database."""
+        return await _run(
+            self.db_connection,
+            lambda session: ReminderRepository(session).add_reminder(title, description, remind_time)
+        )
+    
+    async def add_reminders_bulk(self, reminders: List[Dict]) -> Dict:
+        """Add multiple reminders in a single INSERT."""
+        return await _run(
+            self.db_connection,
+            lambda session: ReminderRepository(session).add_reminders_bulk(reminders)
+        )
+    
+    async def list_reminders(self, limit: int = 100, offset: int = 0) -> Dict:
+        """List active reminders, soonest first, one page at a time."""
+        return await _run(
+            self.db_connection,
+            lambda session: ReminderRepository(session).list_reminders(limit, offset)
+        )
+    
+    async def count_active_reminders(self) -> Dict:
+        """Count active reminders without fetching them."""
+        return await _run(
+            self.db_connection,
+            lambda session: ReminderRepository(session).count_active_reminders()
+        )
+    
+    async def get_reminder(self, reminder_id: int) -> Dict:
+        """Get a specific reminder by ID."""
+        return await _run(
+            self.db_connection,
+            lambda session: ReminderRepository(session).get_reminder(reminder_id)
+        )
+    
+    async def update_reminder(self, reminder_id: int, title: Optional[str] = None,
+                              description: Optional[str] = None, remind_time: Optional[datetime] = None) -> Dict:
+        """Update an existing reminder."""
+        return await _run(
+            self.db_connection,
+            lambda session: ReminderRepository(session).update_reminder(
+                reminder_id, title, description, remind_time
+            )
+        )
+    
+    async def delete_reminder(self, reminder_id: int) -> Dict:
+        """Delete (deactivate) a reminder."""
+        return await _run(
+            self.db_connection,
+            lambda session: ReminderRepository(session).delete_reminder(reminder_id)
+        )
+    
+    async def update_reminders(self, reminder_ids: List[int], title: Optional[str] = None,
+                               description: Optional[str] = None, remind_time: Optional[datetime] = None) -> Dict:
+        """Update several reminders with a single UPDATE."""
+        return await _run(
+            self.db_connection,
+            lambda session: ReminderRepository(session).update_reminders(
+                reminder_ids, title, description, remind_time
+            )
+        )
+    
+    async def delete_reminders(self, reminder_ids: List[int]) -> Dict:
+        """Delete (deactivate) several reminders with a single UPDATE."""
+        return await _run(
+            self.db_connection,
+            lambda session: ReminderRepository(session).delete_reminders(reminder_ids)
+        )
+    
+    async def search_reminders(self, query: str) -> Dict:
+        """Search reminders by title or description."""
+        return await _run(
+            self.db_connection,
+            lambda session: ReminderRepository(session).search_reminders(query)
+        )
+
+
+class AsyncTodoRepository:
+    """
+    Async repository for todo database operations.
+    Single responsibility: Run TodoRepository operations without blocking the event loop.
+    """
+    
+    def __init__(self, db_connection: AsyncDatabaseConnection):
+        self.db_connection = db_connection
+    
+    async def add_todo(self, title: str, description: Optional[str] = None,
+                       priority: str = "medium", due_date: Optional[date] = None) -> Dict:
+        """Add a new todo item to the database."""
+        return await _run(
+            self.db_connection,
+            lambda session: TodoRepository(session).add_todo(title, description, priority, due_date)
+        )
+    
+    async def add_todos_bulk(self, todos: List[Dict]) -> Dict:
+        """Add multiple todo items in a single INSERT."""
+        return await _run(
+            self.db_connection,
+            lambda session: TodoRepository(session).add_todos_bulk(todos)
+        )
+    
+    async def list_todos(self, filter_status: Optional[str] = None,
+                         filter_priority: Optional[str] = None,
+                         cursor: Optional[str] = None, limit: int = 25) -> Dict:
+        """List todo items with optional filtering, newest first, one page at a time."""
+        return await _run(
+            self.db_connection,
+            lambda session: TodoRepository(session).list_todos(filter_status, filter_priority, cursor, limit)
+        )
+    
+    async def get_todo(self, todo_id: int) -> Dict:
+        """Get a specific todo item by ID."""
+        return await _run(
+            self.db_connection,
+            lambda session: TodoRepository(session).get_todo(todo_id)
+        )
+    
+    async def update_todo(self, todo_id: int, title: Optional[str] = None,
+                          description: Optional[str] = None, priority: Optional[str] = None,
+                          status: Optional[str] = None, due_date: Optional[date] = None) -> Dict:
+        """Update an existing todo item."""
+        return await _run(
+            self.db_connection,
+            lambda session: TodoRepository(session).update_todo(
+                todo_id, title, description, priority, status, due_date
+            )
+        )
+    
+    async def delete_todo(self, todo_id: int) -> Dict:
+        """Delete a todo item permanently."""
+        return await _run(
+            self.db_connection,
+            lambda session: TodoRepository(session).delete_todo(todo_id)
+        )
+    
+    async def search_todos(self, query: str, cursor: Optional[str] = None, limit: int = 25) -> Dict:
+        """Search todo items by title or description, newest first, one page at a time."""
+        return await _run(
+            self.db_connection,
+            lambda session: TodoRepository(session).search_todos(query, cursor, limit)
+        )
+    
+    async def get_todo_statistics(self) -> Dict:
+        """Get statistics about todo items."""
+        return await _run(
+            self.db_connection,
+            lambda session: TodoRepository(session).get_todo_statistics()
+        )
@@ -0,0 +1,142 @@
+"""
+Configuration file loading for Heptapal Agent Core.
+Single responsibility: Parse application.yaml and cache the result in a JSON sidecar.
+
+The sidecar sits next to the YAML file as <name>.cache.json and stores
+{"key": [mtime_ns, size], "config": {...}}. It is reused while the YAML
+file's modification time and size are unchanged, so only the first load
+after an edit imports and runs the YAML parser. db.init_db and
+root_agent.config both load the configuration through this module.
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+
+def config_cache_key(config_path: Union[str, Path]) -> Tuple[int, int]:
+    """
+    Build the sidecar cache key for a configuration file.
+    
+    Args:
+        config_path: Path to the YAML configuration file
+    
+    Returns:
+        tuple: (mtime_ns, size) of the file
+    
+    Raises:
+        FileNotFoundError: If the configuration file does not exist
+    """
+    stat = os.stat(config_path)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def config_cache_path(config_path: Union[str, Path]) -> Path:
+    """
+    Locate the JSON sidecar for a configuration file.
+    
+    Args:
+        config_path: Path to the YAML configuration file
+    
+    Returns:
+        Path: Absolute path of the sidecar cache
+    """
+    config_path = Path(config_path).absolute()
+    return config_path.with_name(f"{config_path.name}.cache.json")
+
+
+def read_config_cache(config_path: Union[str, Path], cache_key: Tuple[int, int]) -> Optional[dict]:
+    """
+    Read the parsed configuration from the JSON sidecar cache.
+    
+    Args:
+        config_path: Path to the YAML configuration file
+        cache_key: (mtime_ns, size) of the configuration file
+    
+    Returns:
+        dict: Cached configuration, or None if the cache is missing or stale
+    """
+    try:
+        with open(config_cache_path(config_path), 'r') as file:
+            cached = json.load(file)
+    except (OSError, ValueError):
+        return None
+    
+    if not isinstance(cached, dict) or cached.get("key") != list(cache_key):
+        return None
+    return cached.get("config")
+
+
+def write_config_cache(config_path: Union[str, Path], cache_key: Tuple[int, int], config: dict) -> Path:
+    """
+    Atomically write the parsed configuration to the JSON sidecar cache.
+    
+    A failed write is logged and otherwise ignored; the configuration is
+    then parsed again on the next load.
+    
+    Args:
+        config_path: Path to the YAML configuration file
+        cache_key: (mtime_ns, size) of the configuration file
+        config: Parsed configuration
+    
+    Returns:
+        Path: Path of the sidecar cache
+    """
+    cache_path = config_cache_path(config_path)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'w') as file:
+            json.dump({"key": list(cache_key), "config": config}, file)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning(f"Could not write configuration cache: {e}")
+        tmp_path.unlink(missing_ok=True)
+    return cache_path
+
+
+def parse_config(config_path: Union[str, Path]) -> dict:
+    """
+    Parse a YAML configuration file, using the libyaml C loader when available.
+    
+    yaml is imported here so it is only loaded on a config cache miss.
+    
+    Args:
+        config_path: Path to the YAML configuration file
+    
+    Returns:
+        dict: Parsed configuration
+    """
+    import yaml
+    try:
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeLoader as Loader
+    
+    try:
+        with open(config_path, 'r') as file:
+            return yaml.load(file, Loader=Loader)
+    except yaml.YAMLError as e:
+        logger.error(f"Error parsing configuration file: {e}")
+        raise
+
+
+def load_cached_config(config_path: Union[str, Path], cache_key: Tuple[int, int]) -> dict:
+    """
+    Load a configuration file through its JSON sidecar cache.
+    
+    Args:
+        config_path: Path to the YAML configuration file
+        cache_key: (mtime_ns, size) of the configuration file
+    
+    Returns:
+        dict: Configuration from the sidecar, or freshly parsed and cached
+    """
+    config = read_config_cache(config_path, cache_key)
+    if config is None:
+        config = parse_config(config_path)
+        write_config_cache(config_path, cache_key, config)
+    return config
@@ -3,14 +3,43 @@ Database connection management for Heptapal Agent Core.
 Single responsibility: Handle database connections and session management.
 """
 
+import importlib.util
 import logging
-from typing import Dict, Optional
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
 from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.orm import scoped_session, sessionmaker, Session
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.pool import StaticPool
 
 logger = logging.getLogger(__name__)
 
+# SQLAlchemy MySQL drivers in order of preference: mysqlclient and PyMySQL
+# decode result rows faster than mysql-connector-python
+_DRIVER_MODULES = (
+    ("mysqldb", "MySQLdb"),
+    ("pymysql", "pymysql"),
+    ("mysqlconnector", "mysql.connector"),
+)
+
+
+def _detect_driver() -> str:
+    """
+    Pick the fastest installed MySQL driver.
+    
+    Returns:
+        str: SQLAlchemy driver name
+    """
+    for driver, module in _DRIVER_MODULES:
+        try:
+            if importlib.util.find_spec(module) is not None:
+                return driver
+        except ImportError:
+            continue
+    return "mysqlconnector"
+
 
 class DatabaseConnection:
     """
@@ -27,52 +56,128 @@ class DatabaseConnection:
         self.config = config
         self.engine = None
         self.SessionLocal = None
-        self._connection_string = self._build_connection_string()
+        # Thread-local session registry used by session_scope(); usable as a
+        # Session proxy before the first connect, which it triggers lazily
+        self.ScopedSession = scoped_session(self._create_scoped_session)
+        self._lock = threading.Lock()
+        self._url = self._build_url()
     
-    def _build_connection_string(self) -> str:
+    def _build_url(self) -> URL:
         """
-        Build MySQL connection string from configuration.
+        Build MySQL connection URL from configuration.
+        
+        URL.create escapes special characters in credentials and masks the
+        password when the URL is logged or printed. The driver comes from the
+        'driver' setting (mysqldb, pymysql or mysqlconnector); 'auto' or no
+        setting picks the fastest one installed. A 'url' setting is used
+        as-is instead, e.g. sqlite:///:memory: for tests.
         
         Returns:
-            str: MySQL connection string
+            URL: Database connection URL
         """
-        return (
-            f"mysql+mysqlconnector://{self.config['user']}:{self.config['password']}"
-            f"@{self.config['host']}:{self.config['port']}/{self.config['database']}"
-            f"?charset={self.config.get('charset', 'utf8mb4')}"
+        if 'url' in self.config:
+            return make_url(self.config['url'])
+        
+        driver = self.config.get('driver', 'auto')
+        if driver == 'auto':
+            driver = _detect_driver()
+        
+        return URL.create(
+            f"mysql+{driver}",
+            username=self.config['user'],
+            password=self.config['password'],
+            host=self.config['host'],
+            port=self.config['port'],
+            database=self.config['database'],
+            query={"charset": self.config.get('charset', 'utf8mb4')}
         )
     
+    def _build_engine_kwargs(self) -> Dict:
+        """
+        Build SQLAlchemy engine and pool options from configuration.
+        
+        LIFO checkout reuses the most recently returned connection so idle
+        overflow connections can time out, and pool_recycle replaces
+        connections before MySQL's wait_timeout drops them. query_cache_size
+        bounds the compiled SQL cache shared by the repository statements.
+        
+        SQLite URLs get no MySQL pool settings; an in-memory database lives
+        in one shared connection, so every session and thread sees the
+        same tables.
+        
+        Returns:
+            dict: Keyword arguments for create_engine
+        """
+        if self._url.get_backend_name() == "sqlite":
+            kwargs = {
+                "connect_args": {"check_same_thread": False},
+                "query_cache_size": self.config.get('query_cache_size', 1200),
+                "echo": False
+            }
+            if self._url.database in (None, "", ":memory:"):
+                kwargs["poolclass"] = StaticPool
+            return kwargs
+        
+        return {
+            "pool_size": self.config.get('pool_size', 10),
+            "max_overflow": self.config.get('max_overflow', 20),
+            "pool_timeout": self.config.get('pool_timeout', 30),
+            "pool_use_lifo": self.config.get('pool_use_lifo', True),
+            "pool_recycle": self.config.get('pool_recycle', 1800),
+            "pool_pre_ping": self.config.get('pool_pre_ping', False),
+            "connect_args": {"connect_timeout": self.config.get('connect_timeout', 10)},
+            "query_cache_size": self.config.get('query_cache_size', 1200),
+            "echo": False
+        }
+    
     def connect(self) -> bool:
         """
         Establish database connection and create engine.
         
+        Idempotent: once connected, the existing engine and its pool are
+        reused, so concurrent or repeated calls never create a second engine.
+        
+        pool_pre_ping is off by default: it costs a SELECT 1 round-trip on
+        every checkout. Stale sockets are instead avoided by pool_recycle,
+        and the repositories retry once when a dropped connection is
+        detected. Set pool_pre_ping: true if the server drops idle
+        connections sooner than pool_recycle.
+        
         Returns:
             bool: True if connection successful, False otherwise
         """
-        try:
-            self.engine = create_engine(
-                self._connection_string,
-                pool_size=self.config.get('pool_size', 10),
-                max_overflow=self.config.get('max_overflow', 20),
-                pool_pre_ping=True,
-                echo=False
-            )
-            
-            # Test connection
-            with self.engine.connect() as connection:
-                connection.execute(text("SELECT 1"))
-            
-            self.SessionLocal = sessionmaker(
-                autoflush=False,
-                bind=self.engine
-            )
-            
-            logger.info(f"Successfully connected to database: {self.config['database']}")
-            return True
+        with self._lock:
+            if self.engine is not None:
+                return True
             
-        except SQLAlchemyError as e:
-            logger.error(f"Failed to connect to database: {str(e)}")
-            return False
+            engine = None
+            try:
+                engine = create_engine(
+                    self._url,
+                    **self._build_engine_kwargs()
+                )
+                
+                # Test connection
+                with engine.connect() as connection:
+                    connection.execute(text("SELECT 1"))
+                
+                # Objects stay readable after commit without a reload SELECT;
+                # every session is short-lived, so nothing is served stale
+                self.SessionLocal = sessionmaker(
+                    autoflush=False,
+                    expire_on_commit=False,
+                    bind=engine
+                )
+                self.engine = engine
+                
+                logger.info(f"Successfully connected to database: {self._url.database}")
+                return True
+                
+            except SQLAlchemyError as e:
+                if engine is not None:
+                    engine.dispose()
+                logger.error(f"Failed to connect to database: {str(e)}")
+                return False
     
     def get_session(self) -> Optional[Session]:
         """
@@ -87,13 +192,58 @@ class DatabaseConnection:
         
         return self.SessionLocal()
     
+    def _create_scoped_session(self) -> Session:
+        """
+        Session factory for the thread-local registry, connecting on first use.
+        
+        Returns:
+            Session: New database session
+        
+        Raises:
+            ConnectionError: If the database connection cannot be established
+        """
+        if not self.SessionLocal:
+            if not self.connect():
+                raise ConnectionError("Database connection failed")
+        
+        return self.SessionLocal()
+    
+    @contextmanager
+    def session_scope(self) -> Iterator[Session]:
+        """
+        Provide a transactional scope around a series of operations.
+        
+        Yields the current thread's session, commits on success, rolls back
+        on error, and always closes the session so its connection returns to
+        the pool and its identity map is discarded.
+        
+        Yields:
+            Session: Database session
+        
+        Raises:
+            ConnectionError: If the database connection cannot be established
+        """
+        session = self.ScopedSession()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            self.ScopedSession.remove()
+    
     def close(self):
         """
         Close database connection and dispose engine.
         """
-        if self.engine:
-            self.engine.dispose()
-            logger.info("Database connection closed")
+        self.ScopedSession.remove()
+        with self._lock:
+            if self.engine:
+                self.engine.dispose()
+                self.engine = None
+                self.SessionLocal = None
+                logger.info("Database connection closed")
     
     def create_tables(self, base):
         """
@@ -3,42 +3,99 @@ Database initialization script for Heptapal Agent Core.
 Creates tables and tests database connection.
 """
 
-import yaml
+import argparse
+import hashlib
 import logging
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
-from .connection import DatabaseConnection
-from .models import Base
+from .config_cache import config_cache_key, load_cached_config
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+CONFIG_PATH = Path(__file__).parent.parent / "application.yaml"
+SCHEMA_VERSION_PATH = CONFIG_PATH.with_name(".schema_version")
+
+
+@lru_cache(maxsize=1)
 def load_config() -> dict:
     """
     Load application configuration from application.yaml.
     
+    The parsed result is memoized in-process and cached on disk in a JSON
+    sidecar keyed by the file's mtime and size, so YAML is only parsed
+    after application.yaml changes.
+    
     Returns:
         dict: Application configuration
     """
-    config_path = Path(__file__).parent.parent / "application.yaml"
+    config_path = CONFIG_PATH
     
     try:
-        with open(config_path, 'r') as file:
-            config = yaml.safe_load(file)
-        return config
+        return load_cached_config(config_path, config_cache_key(config_path))
     except FileNotFoundError:
         logger.error(f"Configuration file not found: {config_path}")
         raise
-    except yaml.YAMLError as e:
-        logger.error(f"Error parsing configuration file: {e}")
-        raise
 
 
-def init_database():
+def _schema_version(db_config: dict, base, dialect) -> str:
+    """
+    Fingerprint the model schema and the target database.
+    
+    Args:
+        db_config: Database configuration
+        base: SQLAlchemy declarative base
+        dialect: Dialect the DDL is rendered for
+    
+    Returns:
+        str: SHA-256 of the target and the rendered CREATE TABLE statements
+    """
+    from sqlalchemy.schema import CreateIndex, CreateTable
+    
+    digest = hashlib.sha256()
+    target = f"{db_config.get('host')}:{db_config.get('port')}/{db_config.get('database')}"
+    digest.update(target.encode())
+    for table in base.metadata.sorted_tables:
+        digest.update(str(CreateTable(table).compile(dialect=dialect)).encode())
+        for index in sorted(table.indexes, key=lambda i: i.name or ""):
+            digest.update(str(CreateIndex(index).compile(dialect=dialect)).encode())
+    return digest.hexdigest()
+
+
+def _read_schema_version() -> Optional[str]:
+    """Read the schema fingerprint recorded by the last migration, if any."""
+    try:
+        return SCHEMA_VERSION_PATH.read_text().strip()
+    except OSError:
+        return None
+
+
+def _write_schema_version(version: str):
+    """Record the schema fingerprint after a successful migration."""
+    try:
+        SCHEMA_VERSION_PATH.write_text(version)
+    except OSError as e:
+        logger.warning(f"Could not write schema version file: {e}")
+
+
+def init_database(migrate: bool = False):
     """
-    Initialize database by creating tables and testing connection.
+    Initialize database by testing the connection and, when requested,
+    creating tables.
+    
+    Tables are only created with migrate=True (--migrate) or the database
+    'auto_migrate' setting. With auto_migrate, the DDL is skipped while the
+    schema fingerprint in .schema_version matches the current models.
+    
+    Args:
+        migrate: Create tables regardless of auto_migrate and .schema_version
     """
+    from .connection import DatabaseConnection
+    from .models import Base
+    
     try:
         # Load configuration
         config = load_config()
@@ -59,7 +116,15 @@ def init_database():
         logger.info("Database connection successful")
         
         # Create tables
-        db_connection.create_tables(Base)
+        if migrate or db_config.get('auto_migrate', False):
+            version = _schema_version(db_config, Base, db_connection.engine.dialect)
+            if not migrate and _read_schema_version() == version:
+                logger.info("Schema unchanged since last migration, skipping table creation")
+            else:
+                db_connection.create_tables(Base)
+                _write_schema_version(version)
+        else:
+            logger.info("Skipping table creation (run with --migrate to create tables)")
         
         # Test connection again
         if not db_connection.test_connection():
@@ -75,7 +140,11 @@ def init_database():
 
 
 if __name__ == "__main__":
-    success = init_database()
+    parser = argparse.ArgumentParser(description="Initialize the Heptapal database")
+    parser.add_argument("--migrate", action="store_true", help="Create missing tables")
+    args = parser.parse_args()
+    
+    success = init_database(migrate=args.migrate)
     if success:
         print("✅ Database initialization completed successfully")
     else:
@@ -4,14 +4,32 @@ Single responsibility: Define database table structures and relationships.
 """
 
 from datetime import datetime
+from operator import attrgetter
 from typing import Optional
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, Enum
+from sqlalchemy import Column, Integer, String, Text, Boolean, Date, DateTime, Index, CheckConstraint
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.sql import func
 import enum
 
 Base = declarative_base()
 
+# Fetch all serialized fields of a row in one C-level call
+_reminder_fields = attrgetter("id", "title", "description", "remind_time", "created_at", "is_active")
+_reminder_summary_fields = attrgetter("id", "title", "remind_time", "is_active")
+_todo_fields = attrgetter(
+    "id", "title", "description", "priority", "status", "due_date", "created_at", "completed_at"
+)
+
+
+def _format_datetime(value: Optional[datetime]) -> Optional[str]:
+    """Format a datetime as 'YYYY-MM-DD HH:MM:SS'."""
+    return value.isoformat(sep=' ', timespec='seconds') if value else None
+
+
+def _format_date(value) -> Optional[str]:
+    """Format a date or datetime as 'YYYY-MM-DD'."""
+    return value.isoformat()[:10] if value else None
+
 
 class PriorityEnum(enum.Enum):
     """Priority levels for todo items."""
@@ -33,27 +51,50 @@ class Reminder(Base):
     Stores reminder information with proper indexing and constraints.
     """
     __tablename__ = "reminders"
+    __table_args__ = (
+        # Covers list_reminders: the active filter, (remind_time, id) ordering
+        # and the projected title are all read from the index
+        Index("ix_reminders_cover", "is_active", "remind_time", "id", "title"),
+        {"mysql_charset": "utf8mb4", "mysql_collate": "utf8mb4_unicode_ci"},
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     title = Column(String(255), nullable=False, index=True)
     description = Column(Text, nullable=False)
     remind_time = Column(DateTime, nullable=False, index=True)
     created_at = Column(DateTime, default=func.now(), nullable=False)
-    is_active = Column(Boolean, default=True, nullable=False, index=True)
+    is_active = Column(Boolean, default=True, nullable=False)
     
     def __repr__(self):
         return f"<Reminder(id={self.id}, title='{self.title}', remind_time='{self.remind_time}')>"
     
-    def to_dict(self):
-        """Convert model to dictionary."""
+    @staticmethod
+    def row_to_dict(row) -> dict:
+        """Convert a reminder row (model instance or Core result row) to dictionary."""
+        id_, title, description, remind_time, created_at, is_active = _reminder_fields(row)
         return {
-            "id": self.id,
-            "title": self.title,
-            "description": self.description,
-            "remind_time": self.remind_time.strftime("%Y-%m-%d %H:%M:%S") if self.remind_time else None,
-            "created_at": self.created_at.strftime("%Y-%m-%d %H:%M:%S") if self.created_at else None,
-            "is_active": self.is_active
+            "id": id_,
+            "title": title,
+            "description": description,
+            "remind_time": _format_datetime(remind_time),
+            "created_at": _format_datetime(created_at),
+            "is_active": is_active
         }
+    
+    @staticmethod
+    def row_to_summary_dict(row) -> dict:
+        """Convert a reminder summary row (id, title, remind_time, is_active) to dictionary."""
+        id_, title, remind_time, is_active = _reminder_summary_fields(row)
+        return {
+            "id": id_,
+            "title": title,
+            "remind_time": _format_datetime(remind_time),
+            "is_active": is_active
+        }
+    
+    def to_dict(self):
+        """Convert model to dictionary."""
+        return self.row_to_dict(self)
 
 
 class TodoItem(Base):
@@ -62,28 +103,48 @@ class TodoItem(Base):
     Stores todo information with proper indexing and constraints.
     """
     __tablename__ = "todos"
+    __table_args__ = (
+        # Status-filtered list_todos queries; status alone is served by either prefix
+        Index("ix_todos_status_due_date", "status", "due_date"),
+        Index("ix_todos_status_priority", "status", "priority"),
+        # Overdue count (due_date range, status filter); also serves due_date lookups
+        Index("ix_todos_due_date_status", "due_date", "status"),
+        CheckConstraint("priority IN ('low', 'medium', 'high')", name="ck_todos_priority"),
+        CheckConstraint("status IN ('pending', 'in_progress', 'completed')", name="ck_todos_status"),
+        {"mysql_charset": "utf8mb4", "mysql_collate": "utf8mb4_unicode_ci"},
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     title = Column(String(255), nullable=False, index=True)
     description = Column(Text, nullable=True)
-    priority = Column(Enum(PriorityEnum), default=PriorityEnum.MEDIUM, nullable=False, index=True)
-    status = Column(Enum(StatusEnum), default=StatusEnum.PENDING, nullable=False, index=True)
-    due_date = Column(DateTime, nullable=True, index=True)
+    # Plain strings: values are validated against PriorityEnum/StatusEnum by the
+    # repository and the CHECK constraints, with no per-row Enum type coercion
+    priority = Column(String(12), default=PriorityEnum.MEDIUM.value, nullable=False, index=True)
+    status = Column(String(12), default=StatusEnum.PENDING.value, nullable=False)
+    due_date = Column(Date, nullable=True)
     created_at = Column(DateTime, default=func.now(), nullable=False)
     completed_at = Column(DateTime, nullable=True)
     
     def __repr__(self):
         return f"<TodoItem(id={self.id}, title='{self.title}', status='{self.status}')>"
     
+    @staticmethod
+    def row_to_dict(row) -> dict:
+        """Convert a todo row (model instance or Core result row) to dictionary."""
+        (id_, title, description, priority, status,
+         due_date, created_at, completed_at) = _todo_fields(row)
+        return {
+            "id": id_,
+            "title": title,
+            "description": description,
+            # lower(): tables created from the former Enum columns store member names
+            "priority": priority.lower() if priority else None,
+            "status": status.lower() if status else None,
+            "due_date": _format_date(due_date),
+            "created_at": _format_datetime(created_at),
+            "completed_at": _format_datetime(completed_at)
+        }
+    
     def to_dict(self):
         """Convert model to dictionary."""
-        return {
-            "id": self.id,
-            "title": self.title,
-            "description": self.description,
-            "priority": self.priority.value if self.priority else None,
-            "status": self.status.value if self.status else None,
-            "due_date": self.due_date.strftime("%Y-%m-%d") if self.due_date else None,
-            "created_at": self.created_at.strftime("%Y-%m-%d %H:%M:%S") if self.created_at else None,
-            "completed_at": self.completed_at.strftime("%Y-%m-%d %H:%M:%S") if self.completed_at else None
-        } 
\ No newline at end of file
+        return self.row_to_dict(self) 
\ No newline at end of file
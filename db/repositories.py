@@ -4,16 +4,161 @@ Single responsibility: Handle database operations for reminders and todos.
 """
 
 import logging
-from typing import List, Dict, Optional
-from datetime import datetime, timedelta
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func
-from sqlalchemy.exc import SQLAlchemyError
+from typing import Callable, List, Dict, Optional, TypeVar, Union
+from datetime import date, datetime, timedelta
+from sqlalchemy.orm import Session, scoped_session
+from sqlalchemy import and_, or_, bindparam, func, insert, select, update
+from sqlalchemy.exc import DBAPIError, SQLAlchemyError
 
 from .models import Reminder, TodoItem, PriorityEnum, StatusEnum
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Value -> member lookups; avoids Enum.__call__ dispatch on every request
+_PRIORITY_MAP = {member.value: member for member in PriorityEnum}
+_STATUS_MAP = {member.value: member for member in StatusEnum}
+
+# Hot statements built once at import and executed with bound parameters, so
+# each call skips statement construction and hits the compiled SQL cache
+_GET_REMINDER = select(Reminder).where(Reminder.id == bindparam("reminder_id"))
+# Summary columns only, so MySQL answers from ix_reminders_cover without
+# reading the rows or their TEXT descriptions
+_LIST_ACTIVE_REMINDERS = (
+    select(Reminder.id, Reminder.title, Reminder.remind_time, Reminder.is_active)
+    .where(Reminder.is_active == True)
+    .order_by(Reminder.remind_time, Reminder.id)
+    .limit(bindparam("limit"))
+    .offset(bindparam("offset"))
+)
+# Index-only count on the is_active prefix of ix_reminders_cover
+_COUNT_ACTIVE_REMINDERS = select(func.count()).select_from(Reminder).where(Reminder.is_active == True)
+_SEARCH_REMINDERS = select(Reminder.__table__).where(
+    and_(
+        Reminder.is_active == True,
+        or_(
+            Reminder.title.like(bindparam("pattern"), escape="\\"),
+            Reminder.description.like(bindparam("pattern"), escape="\\")
+        )
+    )
+)
+_DEACTIVATE_REMINDER = (
+    update(Reminder)
+    .where(Reminder.id == bindparam("reminder_id"), Reminder.is_active == True)
+    .values(is_active=False)
+    .execution_options(synchronize_session=False)
+)
+_DEACTIVATE_REMINDERS = (
+    update(Reminder)
+    .where(Reminder.id.in_(bindparam("reminder_ids", expanding=True)), Reminder.is_active == True)
+    .values(is_active=False)
+    .execution_options(synchronize_session=False)
+)
+
+_GET_TODO = select(TodoItem).where(TodoItem.id == bindparam("todo_id"))
+_SEARCH_TODOS = (
+    select(TodoItem.__table__)
+    .where(
+        or_(
+            TodoItem.title.like(bindparam("pattern"), escape="\\"),
+            TodoItem.description.like(bindparam("pattern"), escape="\\")
+        )
+    )
+    .order_by(TodoItem.id.desc())
+    .limit(bindparam("limit"))
+)
+_TODO_COUNTS = (
+    select(TodoItem.status, TodoItem.priority, func.count())
+    .group_by(TodoItem.status, TodoItem.priority)
+)
+# Range scan on ix_todos_due_date_status; both columns are read from the index
+_OVERDUE_TODO_COUNT = select(func.count()).select_from(TodoItem).where(
+    TodoItem.due_date < bindparam("today"),
+    TodoItem.status != StatusEnum.COMPLETED.value
+)
+
+
+def _to_priority(value: str) -> PriorityEnum:
+    """Resolve a priority string (any case) to PriorityEnum, raising ValueError if invalid."""
+    try:
+        return _PRIORITY_MAP[value.lower()]
+    except KeyError:
+        raise ValueError(f"'{value}' is not a valid PriorityEnum") from None
+
+
+def _to_status(value: str) -> StatusEnum:
+    """Resolve a status string (any case) to StatusEnum, raising ValueError if invalid."""
+    try:
+        return _STATUS_MAP[value.lower()]
+    except KeyError:
+        raise ValueError(f"'{value}' is not a valid StatusEnum") from None
+
+
+def _like_pattern(query: str) -> Optional[str]:
+    """
+    Build a substring LIKE pattern for a search query.
+    
+    Returns None for an empty or whitespace-only query, which would otherwise
+    match (and scan) every row. LIKE wildcards in the query are escaped so
+    they match literally.
+    """
+    query = query.strip()
+    if not query:
+        return None
+    escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def _decode_cursor(cursor: Optional[str]) -> Optional[int]:
+    """
+    Decode a todo page cursor into the id the next page starts below.
+    
+    Todos are paged newest first by auto-increment id, so the cursor is the
+    last id of the previous page and the next page is WHERE id < cursor,
+    an index range on the primary key whatever the page number.
+    
+    Raises:
+        ValueError: If the cursor was not produced by a previous page
+    """
+    if not cursor:
+        return None
+    if not cursor.isdigit():
+        raise ValueError(f"'{cursor}' is not a valid cursor")
+    return int(cursor)
+
+
+def _next_cursor(rows: List, limit: int) -> Optional[str]:
+    """Return the cursor for the page after rows (fetched with limit + 1), or None on the last page."""
+    if len(rows) <= limit or limit <= 0:
+        return None
+    return str(rows[limit - 1].id)
+
+
+def _retry_on_disconnect(session: Session, operation: Callable[[], T]) -> T:
+    """
+    Run the first statement of a unit of work, retrying once on a dropped connection.
+    
+    With pool_pre_ping disabled, a pooled connection closed by the server is
+    only detected when it is first used. SQLAlchemy invalidates it, so rolling
+    back and running the operation again checks out a fresh connection.
+    
+    Args:
+        session: Session the operation runs on
+        operation: Callable issuing the statement(s) to run
+    
+    Returns:
+        The operation's result
+    """
+    try:
+        return operation()
+    except DBAPIError as e:
+        if not e.connection_invalidated:
+            raise
+        logger.warning(f"Database connection was dropped, retrying: {str(e)}")
+        session.rollback()
+        return operation()
+
 
 class ReminderRepository:
     """
@@ -21,7 +166,7 @@ class ReminderRepository:
     Single responsibility: Handle all reminder-related database operations.
     """
     
-    def __init__(self, session: Session):
+    def __init__(self, session: Union[Session, scoped_session]):
         self.session = session
     
     def add_reminder(self, title: str, description: str, remind_time: datetime) -> Dict:
@@ -44,8 +189,11 @@ class ReminderRepository:
                 is_active=True
             )
             
-            self.session.add(reminder)
-            self.session.commit()
+            def save():
+                self.session.add(reminder)
+                self.session.commit()
+            
+            _retry_on_disconnect(self.session, save)
             
             return {
                 "status": "success",
@@ -60,20 +208,94 @@ class ReminderRepository:
                 "message": f"Failed to add reminder: {str(e)}"
             }
     
-    def list_reminders(self) -> Dict:
+    def add_reminders_bulk(self, reminders: List[Dict]) -> Dict:
         """
-        List all active reminders.
+        Add multiple reminders in a single INSERT.
+        
+        Rows go through one executemany call instead of a unit-of-work flush
+        and commit per reminder, for import and seed flows.
+        
+        Args:
+            reminders: Dicts with title, description and remind_time (datetime)
         
         Returns:
-            dict: List of all active reminders
+            dict: Status and number of reminders added
         """
+        if not reminders:
+            return {
+                "status": "success",
+                "message": "No reminders to add",
+                "count": 0
+            }
+        
         try:
-            reminders = self.session.query(Reminder).filter(Reminder.is_active == True).all()
+            rows = [
+                {
+                    "title": r["title"],
+                    "description": r["description"],
+                    "remind_time": r["remind_time"],
+                    "is_active": True
+                }
+                for r in reminders
+            ]
+            
+            def save():
+                self.session.execute(insert(Reminder), rows)
+                self.session.commit()
+            
+            _retry_on_disconnect(self.session, save)
             
             return {
                 "status": "success",
-                "message": f"Found {len(reminders)} active reminders",
-                "reminders": [r.to_dict() for r in reminders]
+                "message": f"{len(rows)} reminders added successfully",
+                "count": len(rows)
+            }
+        except KeyError as e:
+            return {
+                "status": "error",
+                "message": f"Missing reminder field: {str(e)}"
+            }
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            logger.error(f"Failed to add reminders: {str(e)}")
+            return {
+                "status": "error",
+                "message": f"Failed to add reminders: {str(e)}"
+            }
+    
+    def list_reminders(self, limit: int = 100, offset: int = 0) -> Dict:
+        """
+        List active reminders, soonest first, one page at a time.
+        
+        Each reminder is a summary (id, title, remind_time, is_active); use
+        get_reminder for the description and creation time.
+        
+        Args:
+            limit: Maximum number of reminders to return
+            offset: Number of reminders to skip
+        
+        Returns:
+            dict: Page of active reminders and whether more follow
+        """
+        try:
+            limit = max(limit, 0)
+            offset = max(offset, 0)
+            # Core row select: skips ORM entity construction for list results.
+            # One extra row tells whether another page follows without a COUNT.
+            rows = _retry_on_disconnect(
+                self.session,
+                lambda: self.session.execute(
+                    _LIST_ACTIVE_REMINDERS, {"limit": limit + 1, "offset": offset}
+                ).all()
+            )
+            has_more = len(rows) > limit
+            rows = rows[:limit]
+            
+            return {
+                "status": "success",
+                "message": f"Found {len(rows)} active reminders",
+                "reminders": [Reminder.row_to_summary_dict(r) for r in rows],
+                "has_more": has_more
             }
         except SQLAlchemyError as e:
             logger.error(f"Failed to list reminders: {str(e)}")
@@ -82,6 +304,31 @@ class ReminderRepository:
                 "message": f"Failed to list reminders: {str(e)}"
             }
     
+    def count_active_reminders(self) -> Dict:
+        """
+        Count active reminders without fetching them.
+        
+        Returns:
+            dict: Status and number of active reminders
+        """
+        try:
+            count = _retry_on_disconnect(
+                self.session,
+                lambda: self.session.execute(_COUNT_ACTIVE_REMINDERS).scalar_one()
+            )
+            
+            return {
+                "status": "success",
+                "message": f"{count} active reminders",
+                "count": count
+            }
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to count reminders: {str(e)}")
+            return {
+                "status": "error",
+                "message": f"Failed to count reminders: {str(e)}"
+            }
+    
     def get_reminder(self, reminder_id: int) -> Dict:
         """
         Get a specific reminder by ID.
@@ -93,7 +340,12 @@ class ReminderRepository:
             dict: Reminder details or error message
         """
         try:
-            reminder = self.session.query(Reminder).filter(Reminder.id == reminder_id).first()
+            reminder = _retry_on_disconnect(
+                self.session,
+                lambda: self.session.execute(
+                    _GET_REMINDER, {"reminder_id": reminder_id}
+                ).scalar_one_or_none()
+            )
             
             if not reminder:
                 return {
@@ -128,7 +380,12 @@ class ReminderRepository:
             dict: Updated reminder details or error message
         """
         try:
-            reminder = self.session.query(Reminder).filter(Reminder.id == reminder_id).first()
+            reminder = _retry_on_disconnect(
+                self.session,
+                lambda: self.session.execute(
+                    _GET_REMINDER, {"reminder_id": reminder_id}
+                ).scalar_one_or_none()
+            )
             
             if not reminder:
                 return {
@@ -158,6 +415,71 @@ class ReminderRepository:
                 "message": f"Failed to update reminder: {str(e)}"
             }
     
+    def update_reminders(self, reminder_ids: List[int], title: Optional[str] = None,
+                         description: Optional[str] = None, remind_time: Optional[datetime] = None) -> Dict:
+        """
+        Update several reminders with a single UPDATE ... WHERE id IN.
+        
+        The same fields are set on every reminder; no row is loaded or
+        tracked by the session.
+        
+        Args:
+            reminder_ids: IDs of the reminders to update
+            title: New title (optional)
+            description: New description (optional)
+            remind_time: New remind time (optional)
+        
+        Returns:
+            dict: Status and number of reminders updated
+        """
+        values = {}
+        if title:
+            values["title"] = title
+        if description:
+            values["description"] = description
+        if remind_time:
+            values["remind_time"] = remind_time
+        
+        if not values:
+            return {
+                "status": "error",
+                "message": "No fields to update"
+            }
+        if not reminder_ids:
+            return {
+                "status": "success",
+                "message": "No reminders to update",
+                "count": 0
+            }
+        
+        try:
+            statement = (
+                update(Reminder)
+                .where(Reminder.id.in_(reminder_ids))
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+            
+            def save():
+                count = self.session.execute(statement).rowcount
+                self.session.commit()
+                return count
+            
+            count = _retry_on_disconnect(self.session, save)
+            
+            return {
+                "status": "success",
+                "message": f"{count} reminders updated successfully",
+                "count": count
+            }
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            logger.error(f"Failed to update reminders: {str(e)}")
+            return {
+                "status": "error",
+                "message": f"Failed to update reminders: {str(e)}"
+            }
+    
     def delete_reminder(self, reminder_id: int) -> Dict:
         """
         Delete (deactivate) a reminder.
@@ -169,20 +491,27 @@ class ReminderRepository:
             dict: Deletion status
         """
         try:
-            reminder = self.session.query(Reminder).filter(Reminder.id == reminder_id).first()
+            # Single UPDATE; no row is loaded or tracked by the session
+            updated = _retry_on_disconnect(
+                self.session,
+                lambda: self.session.execute(
+                    _DEACTIVATE_REMINDER, {"reminder_id": reminder_id}
+                ).rowcount
+            )
             
-            if not reminder:
+            if not updated:
+                # Nothing changed, so there is nothing to commit
+                self.session.rollback()
                 return {
                     "status": "error",
-                    "message": f"Reminder with ID {reminder_id} not found"
+                    "message": f"Reminder with ID {reminder_id} not found or already deleted"
                 }
             
-            reminder.is_active = False
             self.session.commit()
             
             return {
                 "status": "success",
-                "message": f"Reminder '{reminder.title}' deleted successfully"
+                "message": f"Reminder {reminder_id} deleted successfully"
             }
         except SQLAlchemyError as e:
             self.session.rollback()
@@ -192,6 +521,47 @@ class ReminderRepository:
                 "message": f"Failed to delete reminder: {str(e)}"
             }
     
+    def delete_reminders(self, reminder_ids: List[int]) -> Dict:
+        """
+        Delete (deactivate) several reminders with a single UPDATE ... WHERE id IN.
+        
+        Args:
+            reminder_ids: IDs of the reminders to delete
+        
+        Returns:
+            dict: Status and number of reminders deactivated; IDs that are
+                missing or already deleted are not counted
+        """
+        if not reminder_ids:
+            return {
+                "status": "success",
+                "message": "No reminders to delete",
+                "count": 0
+            }
+        
+        try:
+            def save():
+                count = self.session.execute(
+                    _DEACTIVATE_REMINDERS, {"reminder_ids": list(reminder_ids)}
+                ).rowcount
+                self.session.commit()
+                return count
+            
+            count = _retry_on_disconnect(self.session, save)
+            
+            return {
+                "status": "success",
+                "message": f"{count} reminders deleted successfully",
+                "count": count
+            }
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            logger.error(f"Failed to delete reminders: {str(e)}")
+            return {
+                "status": "error",
+                "message": f"Failed to delete reminders: {str(e)}"
+            }
+    
     def search_reminders(self, query: str) -> Dict:
         """
         Search reminders by title or description.
@@ -203,21 +573,25 @@ class ReminderRepository:
             dict: List of matching reminders
         """
         try:
-            query_lower = f"%{query.lower()}%"
-            reminders = self.session.query(Reminder).filter(
-                and_(
-                    Reminder.is_active == True,
-                    or_(
-                        func.lower(Reminder.title).like(query_lower),
-                        func.lower(Reminder.description).like(query_lower)
-                    )
-                )
-            ).all()
+            pattern = _like_pattern(query)
+            if pattern is None:
+                return {
+                    "status": "success",
+                    "message": "Found 0 matching reminders",
+                    "reminders": []
+                }
+            
+            # Columns use the case-insensitive utf8mb4_unicode_ci collation, so a
+            # plain LIKE matches regardless of case
+            rows = _retry_on_disconnect(
+                self.session,
+                lambda: self.session.execute(_SEARCH_REMINDERS, {"pattern": pattern}).all()
+            )
             
             return {
                 "status": "success",
-                "message": f"Found {len(reminders)} matching reminders",
-                "reminders": [r.to_dict() for r in reminders]
+                "message": f"Found {len(rows)} matching reminders",
+                "reminders": [Reminder.row_to_dict(r) for r in rows]
             }
         except SQLAlchemyError as e:
             logger.error(f"Failed to search reminders: {str(e)}")
@@ -233,11 +607,11 @@ class TodoRepository:
     Single responsibility: Handle all todo-related database operations.
     """
     
-    def __init__(self, session: Session):
+    def __init__(self, session: Union[Session, scoped_session]):
         self.session = session
     
     def add_todo(self, title: str, description: Optional[str] = None, 
-                 priority: str = "medium", due_date: Optional[datetime] = None) -> Dict:
+                 priority: str = "medium", due_date: Optional[date] = None) -> Dict:
         """
         Add a new todo item to the database.
         
@@ -251,17 +625,20 @@ class TodoRepository:
             dict: Status and todo item details
         """
         try:
-            priority_enum = PriorityEnum(priority.lower())
+            priority_value = _to_priority(priority).value
             
             todo = TodoItem(
                 title=title,
                 description=description,
-                priority=priority_enum,
+                priority=priority_value,
                 due_date=due_date
             )
             
-            self.session.add(todo)
-            self.session.commit()
+            def save():
+                self.session.add(todo)
+                self.session.commit()
+            
+            _retry_on_disconnect(self.session, save)
             
             return {
                 "status": "success",
@@ -281,40 +658,113 @@ class TodoRepository:
                 "message": f"Failed to add todo: {str(e)}"
             }
     
+    def add_todos_bulk(self, todos: List[Dict]) -> Dict:
+        """
+        Add multiple todo items in a single INSERT.
+        
+        Rows go through one executemany call instead of a unit-of-work flush
+        and commit per todo, for import and seed flows.
+        
+        Args:
+            todos: Dicts with title and optional description, priority
+                (low, medium, high) and due_date (date)
+        
+        Returns:
+            dict: Status and number of todo items added
+        """
+        if not todos:
+            return {
+                "status": "success",
+                "message": "No todo items to add",
+                "count": 0
+            }
+        
+        try:
+            rows = [
+                {
+                    "title": t["title"],
+                    "description": t.get("description"),
+                    "priority": _to_priority(t.get("priority") or "medium").value,
+                    "status": StatusEnum.PENDING.value,
+                    "due_date": t.get("due_date")
+                }
+                for t in todos
+            ]
+            
+            def save():
+                self.session.execute(insert(TodoItem), rows)
+                self.session.commit()
+            
+            _retry_on_disconnect(self.session, save)
+            
+            return {
+                "status": "success",
+                "message": f"{len(rows)} todo items added successfully",
+                "count": len(rows)
+            }
+        except KeyError as e:
+            return {
+                "status": "error",
+                "message": f"Missing todo field: {str(e)}"
+            }
+        except ValueError:
+            return {
+                "status": "error",
+                "message": "Invalid priority. Please choose from 'low', 'medium', or 'high'."
+            }
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            logger.error(f"Failed to add todos: {str(e)}")
+            return {
+                "status": "error",
+                "message": f"Failed to add todos: {str(e)}"
+            }
+    
     def list_todos(self, filter_status: Optional[str] = None, 
-                   filter_priority: Optional[str] = None) -> Dict:
+                   filter_priority: Optional[str] = None,
+                   cursor: Optional[str] = None, limit: int = 25) -> Dict:
         """
-        List todo items with optional filtering.
+        List todo items with optional filtering, newest first, one page at a time.
         
         Args:
             filter_status: Filter by status (pending, in_progress, completed)
             filter_priority: Filter by priority (low, medium, high)
+            cursor: next_cursor from the previous page (optional)
+            limit: Maximum number of todo items to return
         
         Returns:
-            dict: List of todo items
+            dict: Page of todo items and next_cursor (None on the last page)
         """
         try:
-            query = self.session.query(TodoItem)
+            limit = max(limit, 0)
+            before_id = _decode_cursor(cursor)
+            query = select(TodoItem.__table__).order_by(TodoItem.id.desc()).limit(limit + 1)
             
             if filter_status:
-                status_enum = StatusEnum(filter_status.lower())
-                query = query.filter(TodoItem.status == status_enum)
+                status_value = _to_status(filter_status).value
+                query = query.where(TodoItem.status == status_value)
             
             if filter_priority:
-                priority_enum = PriorityEnum(filter_priority.lower())
-                query = query.filter(TodoItem.priority == priority_enum)
+                priority_value = _to_priority(filter_priority).value
+                query = query.where(TodoItem.priority == priority_value)
+            
+            if before_id is not None:
+                query = query.where(TodoItem.id < before_id)
             
-            todos = query.all()
+            rows = _retry_on_disconnect(self.session, lambda: self.session.execute(query).all())
+            next_cursor = _next_cursor(rows, limit)
+            rows = rows[:limit]
             
             return {
                 "status": "success",
-                "message": f"Found {len(todos)} todo items",
-                "todos": [t.to_dict() for t in todos]
+                "message": f"Found {len(rows)} todo items",
+                "todos": [TodoItem.row_to_dict(r) for r in rows],
+                "next_cursor": next_cursor
             }
         except ValueError:
             return {
                 "status": "error",
-                "message": "Invalid filter value. Please check status and priority values."
+                "message": "Invalid filter value. Please check status, priority and cursor values."
             }
         except SQLAlchemyError as e:
             logger.error(f"Failed to list todos: {str(e)}")
@@ -334,7 +784,10 @@ class TodoRepository:
             dict: Todo item details or error message
         """
         try:
-            todo = self.session.query(TodoItem).filter(TodoItem.id == todo_id).first()
+            todo = _retry_on_disconnect(
+                self.session,
+                lambda: self.session.execute(_GET_TODO, {"todo_id": todo_id}).scalar_one_or_none()
+            )
             
             if not todo:
                 return {
@@ -356,7 +809,7 @@ class TodoRepository:
     
     def update_todo(self, todo_id: int, title: Optional[str] = None, 
                    description: Optional[str] = None, priority: Optional[str] = None,
-                   status: Optional[str] = None, due_date: Optional[datetime] = None) -> Dict:
+                   status: Optional[str] = None, due_date: Optional[date] = None) -> Dict:
         """
         Update an existing todo item.
         
@@ -372,7 +825,10 @@ class TodoRepository:
             dict: Updated todo item details or error message
         """
         try:
-            todo = self.session.query(TodoItem).filter(TodoItem.id == todo_id).first()
+            todo = _retry_on_disconnect(
+                self.session,
+                lambda: self.session.execute(_GET_TODO, {"todo_id": todo_id}).scalar_one_or_none()
+            )
             
             if not todo:
                 return {
@@ -385,12 +841,14 @@ class TodoRepository:
             if description:
                 todo.description = description
             if priority:
-                todo.priority = PriorityEnum(priority.lower())
+                todo.priority = _to_priority(priority).value
             if status:
-                todo.status = StatusEnum(status.lower())
-                if status.lower() == "completed" and not todo.completed_at:
-                    todo.completed_at = datetime.now()
-                elif status.lower() != "completed":
+                status_enum = _to_status(status)
+                todo.status = status_enum.value
+                if status_enum is StatusEnum.COMPLETED:
+                    if not todo.completed_at:
+                        todo.completed_at = datetime.now()
+                else:
                     todo.completed_at = None
             if due_date:
                 todo.due_date = due_date
@@ -427,20 +885,24 @@ class TodoRepository:
             dict: Deletion status
         """
         try:
-            todo = self.session.query(TodoItem).filter(TodoItem.id == todo_id).first()
+            # Single DELETE; no row is loaded or tracked by the session
+            deleted = _retry_on_disconnect(
+                self.session,
+                lambda: self.session.query(TodoItem)
+                .filter(TodoItem.id == todo_id)
+                .delete(synchronize_session=False)
+            )
+            self.session.commit()
             
-            if not todo:
+            if not deleted:
                 return {
                     "status": "error",
                     "message": f"Todo item with ID {todo_id} not found"
                 }
             
-            self.session.delete(todo)
-            self.session.commit()
-            
             return {
                 "status": "success",
-                "message": f"Todo item '{todo.title}' deleted successfully"
+                "message": f"Todo item {todo_id} deleted successfully"
             }
         except SQLAlchemyError as e:
             self.session.rollback()
@@ -450,29 +912,53 @@ class TodoRepository:
                 "message": f"Failed to delete todo: {str(e)}"
             }
     
-    def search_todos(self, query: str) -> Dict:
+    def search_todos(self, query: str, cursor: Optional[str] = None, limit: int = 25) -> Dict:
         """
-        Search todo items by title or description.
+        Search todo items by title or description, newest first, one page at a time.
         
         Args:
             query: Search query
+            cursor: next_cursor from the previous page (optional)
+            limit: Maximum number of todo items to return
         
         Returns:
-            dict: List of matching todo items
+            dict: Page of matching todo items and next_cursor (None on the last page)
         """
         try:
-            query_lower = f"%{query.lower()}%"
-            todos = self.session.query(TodoItem).filter(
-                or_(
-                    func.lower(TodoItem.title).like(query_lower),
-                    func.lower(TodoItem.description).like(query_lower)
-                )
-            ).all()
+            limit = max(limit, 0)
+            before_id = _decode_cursor(cursor)
+            pattern = _like_pattern(query)
+            if pattern is None:
+                return {
+                    "status": "success",
+                    "message": "Found 0 matching todo items",
+                    "todos": [],
+                    "next_cursor": None
+                }
+            
+            statement = _SEARCH_TODOS
+            if before_id is not None:
+                statement = statement.where(TodoItem.id < before_id)
+            
+            # Columns use the case-insensitive utf8mb4_unicode_ci collation, so a
+            # plain LIKE matches regardless of case
+            rows = _retry_on_disconnect(
+                self.session,
+                lambda: self.session.execute(statement, {"pattern": pattern, "limit": limit + 1}).all()
+            )
+            next_cursor = _next_cursor(rows, limit)
+            rows = rows[:limit]
             
             return {
                 "status": "success",
-                "message": f"Found {len(todos)} matching todo items",
-                "todos": [t.to_dict() for t in todos]
+                "message": f"Found {len(rows)} matching todo items",
+                "todos": [TodoItem.row_to_dict(r) for r in rows],
+                "next_cursor": next_cursor
+            }
+        except ValueError as e:
+            return {
+                "status": "error",
+                "message": f"Invalid value: {str(e)}"
             }
         except SQLAlchemyError as e:
             logger.error(f"Failed to search todos: {str(e)}")
@@ -489,14 +975,28 @@ class TodoRepository:
             dict: Various statistics about todo items
         """
         try:
-            total_todos = self.session.query(TodoItem).count()
-            pending_todos = self.session.query(TodoItem).filter(TodoItem.status == StatusEnum.PENDING).count()
-            in_progress_todos = self.session.query(TodoItem).filter(TodoItem.status == StatusEnum.IN_PROGRESS).count()
-            completed_todos = self.session.query(TodoItem).filter(TodoItem.status == StatusEnum.COMPLETED).count()
+            # One GROUP BY round-trip instead of a COUNT(*) per status and priority
+            rows = _retry_on_disconnect(
+                self.session,
+                lambda: self.session.execute(_TODO_COUNTS).all()
+            )
+            
+            overdue_todos = self.session.execute(_OVERDUE_TODO_COUNT, {"today": date.today()}).scalar_one()
+            
+            status_counts = {status.value: 0 for status in StatusEnum}
+            priority_counts = {priority.value: 0 for priority in PriorityEnum}
+            for status, priority, count in rows:
+                status_counts[status.lower()] += count
+                priority_counts[priority.lower()] += count
+            
+            total_todos = sum(status_counts.values())
+            pending_todos = status_counts[StatusEnum.PENDING.value]
+            in_progress_todos = status_counts[StatusEnum.IN_PROGRESS.value]
+            completed_todos = status_counts[StatusEnum.COMPLETED.value]
             
-            high_priority = self.session.query(TodoItem).filter(TodoItem.priority == PriorityEnum.HIGH).count()
-            medium_priority = self.session.query(TodoItem).filter(TodoItem.priority == PriorityEnum.MEDIUM).count()
-            low_priority = self.session.query(TodoItem).filter(TodoItem.priority == PriorityEnum.LOW).count()
+            high_priority = priority_counts[PriorityEnum.HIGH.value]
+            medium_priority = priority_counts[PriorityEnum.MEDIUM.value]
+            low_priority = priority_counts[PriorityEnum.LOW.value]
             
             return {
                 "status": "success",
@@ -505,6 +1005,7 @@ class TodoRepository:
                     "pending": pending_todos,
                     "in_progress": in_progress_todos,
                     "completed": completed_todos,
+                    "overdue": overdue_todos,
                     "high_priority": high_priority,
                     "medium_priority": medium_priority,
                     "low_priority": low_priority
@@ -9,17 +9,16 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from root_agent.config import load_config
 from root_agent.utils import get_logger
-from root_agent.sub_agents.reminder_agent.agent import reminder_agent
-from root_agent.sub_agents.todo_agent.agent import todo_agent
 
 logger = get_logger(__name__)
 
+_SEPARATOR = "=" * 60
+
 def print_separator(title: str):
     """Print a nice separator for demo sections"""
-    logger.info("\n" + "="*60)
-    logger.info(f"  {title}")
-    logger.info("="*60)
+    logger.info("\n%s\n  %s\n%s", _SEPARATOR, title, _SEPARATOR)
 
 def demo_reminder_agent():
     """Demonstrate the reminder agent capabilities"""
@@ -28,13 +27,15 @@ def demo_reminder_agent():
     # Import reminder tools to call them directly for demo
     from root_agent.sub_agents.reminder_agent.tools.reminder_tools import ReminderTools
     
-    reminder_tools = ReminderTools()
+    reminder_tools = ReminderTools(load_config())
     
     logger.info("\n1. Adding sample reminders...")
-    reminder_tools.add_reminder("Doctor Appointment", "Annual health checkup with Dr. Smith", "2024-12-20 10:00")
-    reminder_tools.add_reminder("Call Mom", "Weekly call with mom to catch up", "2024-12-18 19:00")
-    reminder_tools.add_reminder("Pick up Groceries", "Buy milk, bread, and eggs from the store", "2024-12-17 17:00")
-    reminder_tools.add_reminder("Team Meeting", "Weekly team standup meeting", "2024-12-19 09:00")
+    reminder_tools.add_reminders([
+        {"title": "Doctor Appointment", "description": "Annual health checkup with Dr. Smith", "remind_time": "2024-12-20 10:00"},
+        {"title": "Call Mom", "description": "Weekly call with mom to catch up", "remind_time": "2024-12-18 19:00"},
+        {"title": "Pick up Groceries", "description": "Buy milk, bread, and eggs from the store", "remind_time": "2024-12-17 17:00"},
+        {"title": "Team Meeting", "description": "Weekly team standup meeting", "remind_time": "2024-12-19 09:00"}
+    ])
     
     logger.info("\n2. Listing all reminders...")
     logger.info(reminder_tools.list_reminders())
@@ -60,12 +61,8 @@ def demo_todo_agent():
     
     # Import todo tools to call them directly for demo
     from root_agent.sub_agents.todo_agent.tools.todo_tools import TodoTools
-    import yaml
-    
-    with open("application.yaml", "r") as f:
-        config = yaml.safe_load(f)
     
-    todo_tools = TodoTools(config)
+    todo_tools = TodoTools(load_config())
     
     logger.info("\n1. Adding sample todo items...")
     todo_tools.add_todo(title="Complete Project Report", description="Finish the Q4 project report for presentation", priority="high", due_date="2024-12-20")
@@ -108,8 +105,10 @@ def demo_root_agent_delegation():
     """Demonstrate root agent delegation logic"""
     print_separator("ROOT AGENT DELEGATION DEMO")
     
-    # Import the root agent
+    # Import the agents; this builds the ADK agents and their tools
     from root_agent.agent import root_agent
+    from root_agent.sub_agents.reminder_agent.agent import reminder_agent
+    from root_agent.sub_agents.todo_agent.agent import todo_agent
     
     print("\n1. Testing root agent delegation...")
     print("Note: This would require ADK CLI to run the agent interactively")
@@ -1,5 +1,22 @@
-from .agent import root_agent
-from .sub_agents.reminder_agent import reminder_agent
-from .sub_agents.todo_agent import todo_agent
+"""
+Heptapal agents.
 
-__all__ = ['root_agent', 'reminder_agent', 'todo_agent'] 
\ No newline at end of file
+Exports are resolved lazily (PEP 562) so importing a submodule such as
+root_agent.utils or a tools module does not build the agents, their tools
+and database connections.
+"""
+
+__all__ = ['root_agent', 'reminder_agent', 'todo_agent']
+
+
+def __getattr__(name):
+    if name == 'root_agent':
+        from .agent import root_agent
+        return root_agent
+    if name == 'reminder_agent':
+        from .sub_agents.reminder_agent import reminder_agent
+        return reminder_agent
+    if name == 'todo_agent':
+        from .sub_agents.todo_agent import todo_agent
+        return todo_agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
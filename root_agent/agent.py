@@ -1,42 +1,15 @@
+from functools import lru_cache
+
 from google.adk.agents import Agent
 from google.adk.tools import FunctionTool
-from .sub_agents.reminder_agent.tools.reminder_tools import ReminderTools
-from .sub_agents.todo_agent.tools.todo_tools import TodoTools
+from .sub_agents.reminder_agent.agent import get_reminder_tools
+from .sub_agents.todo_agent.agent import get_todo_tools
+from .config import load_config
 from .utils import get_logger
-import yaml
 
 logger = get_logger(__name__)
 
-with open("application.yaml", "r") as f:
-    config = yaml.safe_load(f)
-
-# Initialize tools
-reminder_tools = ReminderTools(config)
-todo_tools = TodoTools(config)
-
-# Create FunctionTools for all operations
-# Reminder tools
-add_reminder_tool = FunctionTool(func=reminder_tools.add_reminder)
-list_reminders_tool = FunctionTool(func=reminder_tools.list_reminders)
-get_reminder_tool = FunctionTool(func=reminder_tools.get_reminder)
-update_reminder_tool = FunctionTool(func=reminder_tools.update_reminder)
-delete_reminder_tool = FunctionTool(func=reminder_tools.delete_reminder)
-search_reminders_tool = FunctionTool(func=reminder_tools.search_reminders)
-
-# Todo tools
-add_todo_tool = FunctionTool(func=todo_tools.add_todo)
-list_todos_tool = FunctionTool(func=todo_tools.list_todos)
-get_todo_tool = FunctionTool(func=todo_tools.get_todo)
-update_todo_tool = FunctionTool(func=todo_tools.update_todo)
-delete_todo_tool = FunctionTool(func=todo_tools.delete_todo)
-search_todos_tool = FunctionTool(func=todo_tools.search_todos)
-get_todo_statistics_tool = FunctionTool(func=todo_tools.get_todo_statistics)
-
-root_agent = Agent(
-    name="root_agent",
-    model=config.get("model", "gemini-2.0-flash"),
-    description="Intelligent delegation agent that routes user requests to specialized sub-agents",
-    instruction="""
+_INSTRUCTION = """
     You are a root delegation agent that intelligently routes user requests to the appropriate specialized tools.
     Your main task is to analyze the user's request and use the correct tools.
     
@@ -51,7 +24,8 @@ root_agent = Agent(
     
     - For todo-related tasks (tasks to complete, action items, project work), use todo tools:
       * add_todo_tool: Create new todo items
-      * list_todos_tool: Show todos with optional filtering
+      * add_todos_tool: Create several todo items at once (prefer it when the user lists multiple tasks)
+      * list_todos_tool: Show todos with optional filtering (paged; pass next_cursor as cursor for more)
       * get_todo_tool: Get specific todo details
       * update_todo_tool: Modify existing todos
       * delete_todo_tool: Remove todos
@@ -70,22 +44,47 @@ root_agent = Agent(
     - Always use the most appropriate tool for the request
     - If a request is ambiguous, ask for clarification
     - Provide clear responses about what action was taken
-    """,
-    tools=[
-        # Reminder tools
-        add_reminder_tool,
-        list_reminders_tool,
-        get_reminder_tool,
-        update_reminder_tool,
-        delete_reminder_tool,
-        search_reminders_tool,
-        # Todo tools
-        add_todo_tool,
-        list_todos_tool,
-        get_todo_tool,
-        update_todo_tool,
-        delete_todo_tool,
-        search_todos_tool,
-        get_todo_statistics_tool
-    ]
-)
+    """
+
+
+@lru_cache(maxsize=1)
+def get_root_agent() -> Agent:
+    """
+    Build the root agent and its FunctionTools on first use.
+    
+    Tools are shared with the sub-agents so each has a single database connection pool.
+    """
+    config = load_config()
+    reminder_tools = get_reminder_tools()
+    todo_tools = get_todo_tools()
+    return Agent(
+        name="root_agent",
+        model=config.get("model", "gemini-2.0-flash"),
+        description="Intelligent delegation agent that routes user requests to specialized sub-agents",
+        instruction=_INSTRUCTION,
+        tools=[
+            # Reminder tools
+            FunctionTool(func=reminder_tools.add_reminder),
+            FunctionTool(func=reminder_tools.list_reminders),
+            FunctionTool(func=reminder_tools.get_reminder),
+            FunctionTool(func=reminder_tools.update_reminder),
+            FunctionTool(func=reminder_tools.delete_reminder),
+            FunctionTool(func=reminder_tools.search_reminders),
+            # Todo tools
+            FunctionTool(func=todo_tools.add_todo),
+            FunctionTool(func=todo_tools.add_todos),
+            FunctionTool(func=todo_tools.list_todos),
+            FunctionTool(func=todo_tools.get_todo),
+            FunctionTool(func=todo_tools.update_todo),
+            FunctionTool(func=todo_tools.delete_todo),
+            FunctionTool(func=todo_tools.search_todos),
+            FunctionTool(func=todo_tools.get_todo_statistics)
+        ]
+    )
+
+
+def __getattr__(name):
+    # PEP 562: `from root_agent.agent import root_agent` builds the agent on first access
+    if name == 'root_agent':
+        return get_root_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
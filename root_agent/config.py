@@ -0,0 +1,70 @@
+"""
+Application configuration for the Heptapal agents.
+Single responsibility: Load application.yaml once per file version for every agent module.
+
+Parsing and the JSON sidecar cache live in db.config_cache, shared with
+db.init_db. Run `python -m root_agent.config` to write the sidecar ahead
+of time.
+"""
+
+import os
+import sys
+from functools import lru_cache
+from typing import Tuple
+
+from db.config_cache import config_cache_key, load_cached_config, parse_config, write_config_cache
+
+
+@lru_cache(maxsize=8)
+def _load(path: str, cache_key: Tuple[int, int]) -> dict:
+    """
+    Load a configuration file version once per process.
+    
+    Args:
+        path: Absolute path to the YAML configuration file
+        cache_key: (mtime_ns, size) of the file, so an edited file is reloaded
+    
+    Returns:
+        dict: Parsed configuration
+    """
+    return load_cached_config(path, cache_key)
+
+
+def load_config(path: str = "application.yaml") -> dict:
+    """
+    Load the application configuration, parsing the YAML once per file version.
+    
+    Results are cached by absolute path, modification time and size, in
+    process and in a JSON sidecar next to the file, so every agent module
+    and test shares one parse and later processes skip YAML entirely until
+    the file changes. The returned dict is shared between callers and must
+    not be mutated.
+    
+    Args:
+        path: Path to the YAML configuration file
+    
+    Returns:
+        dict: Application configuration
+    """
+    return _load(os.path.abspath(path), config_cache_key(path))
+
+
+def compile_config(path: str = "application.yaml") -> str:
+    """
+    Parse the YAML now and write its JSON sidecar for later processes.
+    
+    Run once after install or after editing the file, so the first
+    load_config in every process reads JSON only and never imports yaml.
+    
+    Args:
+        path: Path to the YAML configuration file
+    
+    Returns:
+        str: Path of the written sidecar
+    """
+    cache_key = config_cache_key(path)
+    return str(write_config_cache(path, cache_key, parse_config(path)))
+
+
+if __name__ == "__main__":
+    print(compile_config(*sys.argv[1:2]))
@@ -1,3 +1,8 @@
-from .agent import reminder_agent
+__all__ = ['reminder_agent']
 
-__all__ = ['reminder_agent'] 
\ No newline at end of file
+
+def __getattr__(name):
+    if name == 'reminder_agent':
+        from .agent import reminder_agent
+        return reminder_agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
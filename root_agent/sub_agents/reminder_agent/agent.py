@@ -1,32 +1,18 @@
+from functools import lru_cache
+
 from google.adk.agents import Agent
 from google.adk.tools import FunctionTool
 from .tools.reminder_tools import ReminderTools
+from ...config import load_config
 from ...utils import get_logger
-import yaml
 
 logger = get_logger(__name__)
 
-with open("application.yaml", "r") as f:
-    config = yaml.safe_load(f)
-
-reminder_tools = ReminderTools(config)
-
-add_reminder_tool = FunctionTool(func=reminder_tools.add_reminder)
-list_reminders_tool = FunctionTool(func=reminder_tools.list_reminders)
-get_reminder_tool = FunctionTool(func=reminder_tools.get_reminder)
-update_reminder_tool = FunctionTool(func=reminder_tools.update_reminder)
-delete_reminder_tool = FunctionTool(func=reminder_tools.delete_reminder)
-search_reminders_tool = FunctionTool(func=reminder_tools.search_reminders)
-
-reminder_agent = Agent(
-    name="reminder_agent",
-    model=config.get("model", "gemini-2.0-flash"),
-    description="Notifies you at a specific time",
-    instruction="""
+_INSTRUCTION = """
     You are a Reminder Agent. Your job is to manage user reminders, which are always time-based.
     You can perform the following operations on reminders:
     - Add a new reminder using `add_reminder_tool`.
-    - List all active reminders using `list_reminders_tool`.
+    - List active reminders using `list_reminders_tool` (paged: if has_more is true, call again with a larger offset).
     - Get a specific reminder by ID using `get_reminder_tool`.
     - Update an existing reminder using `update_reminder_tool`.
     - Delete (deactivate) a reminder using `delete_reminder_tool`.
@@ -36,13 +22,40 @@ reminder_agent = Agent(
     Example: "Take medicine at 8 PM"
     If the user asks about todos or tasks, escalate to the root agent by responding with: "ESCALATE_TO_ROOT: This is a todo/task request..."
     If the request is outside of your domain, escalate to the root agent by responding with: "ESCALATE_TO_ROOT: This request is outside my reminder domain..."
-    """,
-    tools=[
-        add_reminder_tool,
-        list_reminders_tool,
-        get_reminder_tool,
-        update_reminder_tool,
-        delete_reminder_tool,
-        search_reminders_tool
-    ]
-)
+    """
+
+
+@lru_cache(maxsize=1)
+def get_reminder_tools() -> ReminderTools:
+    """Create the shared ReminderTools, and with it the database connection pool, on first use."""
+    return ReminderTools(load_config())
+
+
+@lru_cache(maxsize=1)
+def get_reminder_agent() -> Agent:
+    """Build the reminder agent and its FunctionTools on first use."""
+    config = load_config()
+    reminder_tools = get_reminder_tools()
+    return Agent(
+        name="reminder_agent",
+        model=config.get("model", "gemini-2.0-flash"),
+        description="Notifies you at a specific time",
+        instruction=_INSTRUCTION,
+        tools=[
+            FunctionTool(func=reminder_tools.add_reminder),
+            FunctionTool(func=reminder_tools.list_reminders),
+            FunctionTool(func=reminder_tools.get_reminder),
+            FunctionTool(func=reminder_tools.update_reminder),
+            FunctionTool(func=reminder_tools.delete_reminder),
+            FunctionTool(func=reminder_tools.search_reminders)
+        ]
+    )
+
+
+def __getattr__(name):
+    # PEP 562: `from .agent import reminder_agent` builds the agent on first access
+    if name == 'reminder_agent':
+        return get_reminder_agent()
+    if name == 'reminder_tools':
+        return get_reminder_tools()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
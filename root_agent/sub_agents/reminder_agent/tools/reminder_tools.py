@@ -1,22 +1,42 @@
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
-from pydantic import BaseModel, Field
+from __future__ import annotations
+
+import re
+from datetime import datetime, time, timedelta
+from typing import Optional
 
 from db.connection import DatabaseConnection
 from db.repositories import ReminderRepository
 
+# Absolute date-times ("2024-12-15 15:30[:00]") are used as-is; clock times
+# ("3 PM", "10:15 am", "15:30") are combined with today or tomorrow
+_DATETIME_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})[ T](\d{1,2}):(\d{2})(?::(\d{2}))?")
+_CLOCK_RE = re.compile(
+    r"\b(?:(\d{1,2})(?::(\d{2}))?\s*([ap])\.?m\b\.?|(\d{1,2}):(\d{2}))",
+    re.IGNORECASE
+)
+
 
-class Reminder(BaseModel):
-    id: int = Field(..., description="Unique identifier for the reminder.")
-    title: str = Field(..., description="Short title for the reminder.")
-    description: str = Field(..., description="Detailed description of what to be reminded about.")
-    remind_time: str = Field(..., description="The specific time or expression when the reminder should trigger (e.g., '2024-12-15 15:30', 'tomorrow at 3 PM').")
-    created_at: str = Field(default_factory=lambda: datetime.now().strftime("%Y-%m-%d %H:%M:%S"), description="Timestamp when the reminder was created.")
-    is_active: bool = Field(True, description="Boolean indicating if the reminder is currently active.")
+def _parse_clock(text: str) -> Optional[time]:
+    """Extract a clock time such as '3 PM' or '09:00' from text, or return None if there is none."""
+    match = _CLOCK_RE.search(text)
+    if not match:
+        return None
+    
+    hour_12, minute_12, meridiem, hour_24, minute_24 = match.groups()
+    try:
+        if meridiem:
+            hour = int(hour_12)
+            if not 1 <= hour <= 12:
+                return None
+            hour = hour % 12 + (12 if meridiem.lower() == "p" else 0)
+            return time(hour, int(minute_12 or 0))
+        return time(int(hour_24), int(minute_24))
+    except ValueError:
+        return None
 
 
 class ReminderTools:
-    def __init__(self, config: Dict):
+    def __init__(self, config: dict):
         """
         Initialize ReminderTools with database connection.
         
@@ -26,37 +46,65 @@ class ReminderTools:
         self.config = config
         self.db_connection = DatabaseConnection(config.get('database', {}))
         self.db_connection.connect()
+        # Bound once to the thread-local session registry: inside session_scope()
+        # it resolves to the session that scope commits and closes
+        self.repository = ReminderRepository(self.db_connection.ScopedSession)
     
-    def _parse_remind_time(self, remind_time: str) -> datetime:
+    def _parse_remind_time(self, remind_time: str, now: Optional[datetime] = None) -> datetime:
         """
         Parse remind_time string into datetime object.
         
         Args:
             remind_time: Time string (e.g., "2024-12-15 15:30", "tomorrow at 3 PM")
+            now: Reference time for relative expressions (defaults to the current time)
         
         Returns:
             datetime: Parsed datetime object
         """
-        remind_time_lower = remind_time.lower()
-        now = datetime.now()
+        text = remind_time.strip()
+        
+        match = _DATETIME_RE.fullmatch(text)
+        if match:
+            return datetime(*(int(part) for part in match.groups(default="0")))
+        
+        if now is None:
+            now = datetime.now()
+        remind_date = now.date()
+        if "tomorrow" in text.lower():
+            remind_date += timedelta(days=1)
         
-        if "tomorrow" in remind_time_lower:
-            remind_date = now.date() + timedelta(days=1)
-        else:
-            remind_date = now.date()
+        remind_time_obj = _parse_clock(text) or now.time()
+        return datetime.combine(remind_date, remind_time_obj)
 
-        time_str = remind_time_lower.replace("tomorrow", "").strip()
+    def _build_reminder(self, item: dict, now: datetime) -> dict:
+        """
+        Validate one add_reminders entry and parse its remind_time.
+        
+        Returns:
+            dict: title, description and parsed remind_time for the repository
+        
+        Raises:
+            ValueError: With a user-facing message if the entry is invalid
+        """
+        if not isinstance(item, dict):
+            raise ValueError("Each reminder must have a title, description and remind_time.")
+        
+        for field in ("title", "description", "remind_time"):
+            if not isinstance(item.get(field), str) or not item[field].strip():
+                raise ValueError(f"Missing {field}.")
+        
         try:
-            remind_time_obj = datetime.strptime(time_str, "%I %p").time()
+            remind_time = self._parse_remind_time(item["remind_time"], now)
         except ValueError:
-            try:
-                remind_time_obj = datetime.strptime(time_str, "%H:%M").time()
-            except ValueError:
-                remind_time_obj = now.time()
+            raise ValueError(f"Invalid remind_time '{item['remind_time']}'.")
         
-        return datetime.combine(remind_date, remind_time_obj)
+        return {
+            "title": item["title"],
+            "description": item["description"],
+            "remind_time": remind_time
+        }
 
-    def add_reminder(self, title: str, description: str, remind_time: str) -> Dict:
+    def add_reminder(self, title: str, description: str, remind_time: str) -> dict:
         """
         Add a new reminder to the system.
         Args:
@@ -69,50 +117,97 @@ class ReminderTools:
         try:
             parsed_time = self._parse_remind_time(remind_time)
             
-            session = self.db_connection.get_session()
-            if not session:
-                return {
-                    "status": "error",
-                    "message": "Database connection failed"
-                }
-            
-            repository = ReminderRepository(session)
-            result = repository.add_reminder(title, description, parsed_time)
-            session.close()
-            
-            return result
+            with self.db_connection.session_scope():
+                return self.repository.add_reminder(title, description, parsed_time)
+        except ConnectionError:
+            return {
+                "status": "error",
+                "message": "Database connection failed"
+            }
         except Exception as e:
             return {
                 "status": "error",
                 "message": f"Failed to add reminder: {str(e)}"
             }
 
-    def list_reminders(self) -> Dict:
+    def add_reminders(self, reminders: list[dict]) -> dict:
         """
-        List all active reminders.
+        Add multiple reminders in one session and a single INSERT.
+        Args:
+            reminders: Dicts with title, description and remind_time (same formats as add_reminder)
         Returns:
-            dict: List of all active reminders
+            dict: Status and number of reminders added
         """
         try:
-            session = self.db_connection.get_session()
-            if not session:
-                return {
-                    "status": "error",
-                    "message": "Database connection failed"
-                }
-            
-            repository = ReminderRepository(session)
-            result = repository.list_reminders()
-            session.close()
+            now = datetime.now()
+            rows = []
+            for number, item in enumerate(reminders, 1):
+                try:
+                    rows.append(self._build_reminder(item, now))
+                except ValueError as e:
+                    return {
+                        "status": "error",
+                        "message": f"Reminder {number}: {str(e)} No reminders were added."
+                    }
             
-            return result
+            with self.db_connection.session_scope():
+                return self.repository.add_reminders_bulk(rows)
+        except ConnectionError:
+            return {
+                "status": "error",
+                "message": "Database connection failed"
+            }
+        except Exception as e:
+            return {
+                "status": "error",
+                "message": f"Failed to add reminders: {str(e)}"
+            }
+
+    def list_reminders(self, limit: int = 100, offset: int = 0) -> dict:
+        """
+        List active reminders, soonest first, one page at a time.
+        Each entry has the id, title and remind time; use get_reminder for the description.
+        Args:
+            limit: Maximum number of reminders to return (default 100)
+            offset: Number of reminders to skip, for fetching the next page (default 0)
+        Returns:
+            dict: Page of active reminders; has_more is true if more reminders follow
+        """
+        try:
+            with self.db_connection.session_scope():
+                return self.repository.list_reminders(limit, offset)
+        except ConnectionError:
+            return {
+                "status": "error",
+                "message": "Database connection failed"
+            }
         except Exception as e:
             return {
                 "status": "error",
                 "message": f"Failed to list reminders: {str(e)}"
             }
 
-    def get_reminder(self, reminder_id: int) -> Dict:
+    def count_active_reminders(self) -> dict:
+        """
+        Count active reminders without listing them.
+        Returns:
+            dict: Status and number of active reminders
+        """
+        try:
+            with self.db_connection.session_scope():
+                return self.repository.count_active_reminders()
+        except ConnectionError:
+            return {
+                "status": "error",
+                "message": "Database connection failed"
+            }
+        except Exception as e:
+            return {
+                "status": "error",
+                "message": f"Failed to count reminders: {str(e)}"
+            }
+
+    def get_reminder(self, reminder_id: int) -> dict:
         """
         Get a specific reminder by ID.
         Args:
@@ -121,25 +216,20 @@ class ReminderTools:
             dict: Reminder details or error message
         """
         try:
-            session = self.db_connection.get_session()
-            if not session:
-                return {
-                    "status": "error",
-                    "message": "Database connection failed"
-                }
-            
-            repository = ReminderRepository(session)
-            result = repository.get_reminder(reminder_id)
-            session.close()
-            
-            return result
+            with self.db_connection.session_scope():
+                return self.repository.get_reminder(reminder_id)
+        except ConnectionError:
+            return {
+                "status": "error",
+                "message": "Database connection failed"
+            }
         except Exception as e:
             return {
                 "status": "error",
                 "message": f"Failed to get reminder: {str(e)}"
             }
 
-    def update_reminder(self, reminder_id: int, title: Optional[str] = None, description: Optional[str] = None, remind_time: Optional[str] = None) -> Dict:
+    def update_reminder(self, reminder_id: int, title: Optional[str] = None, description: Optional[str] = None, remind_time: Optional[str] = None) -> dict:
         """
         Update an existing reminder.
         Args:
@@ -155,25 +245,20 @@ class ReminderTools:
             if remind_time:
                 parsed_time = self._parse_remind_time(remind_time)
             
-            session = self.db_connection.get_session()
-            if not session:
-                return {
-                    "status": "error",
-                    "message": "Database connection failed"
-                }
-            
-            repository = ReminderRepository(session)
-            result = repository.update_reminder(reminder_id, title, description, parsed_time)
-            session.close()
-            
-            return result
+            with self.db_connection.session_scope():
+                return self.repository.update_reminder(reminder_id, title, description, parsed_time)
+        except ConnectionError:
+            return {
+                "status": "error",
+                "message": "Database connection failed"
+            }
         except Exception as e:
             return {
                 "status": "error",
                 "message": f"Failed to update reminder: {str(e)}"
             }
 
-    def delete_reminder(self, reminder_id: int) -> Dict:
+    def delete_reminder(self, reminder_id: int) -> dict:
         """
         Delete (deactivate) a reminder.
         Args:
@@ -182,25 +267,20 @@ class ReminderTools:
             dict: Deletion status
         """
         try:
-            session = self.db_connection.get_session()
-            if not session:
-                return {
-                    "status": "error",
-                    "message": "Database connection failed"
-                }
-            
-            repository = ReminderRepository(session)
-            result = repository.delete_reminder(reminder_id)
-            session.close()
-            
-            return result
+            with self.db_connection.session_scope():
+                return self.repository.delete_reminder(reminder_id)
+        except ConnectionError:
+            return {
+                "status": "error",
+                "message": "Database connection failed"
+            }
         except Exception as e:
             return {
                 "status": "error",
                 "message": f"Failed to delete reminder: {str(e)}"
             }
 
-    def search_reminders(self, query: str) -> Dict:
+    def search_reminders(self, query: str) -> dict:
         """
         Search reminders by title or description.
         Args:
@@ -209,18 +289,13 @@ class ReminderTools:
             dict: List of matching reminders
         """
         try:
-            session = self.db_connection.get_session()
-            if not session:
-                return {
-                    "status": "error",
-                    "message": "Database connection failed"
-                }
-            
-            repository = ReminderRepository(session)
-            result = repository.search_reminders(query)
-            session.close()
-            
-            return result
+            with self.db_connection.session_scope():
+                return self.repository.search_reminders(query)
+        except ConnectionError:
+            return {
+                "status": "error",
+                "message": "Database connection failed"
+            }
         except Exception as e:
             return {
                 "status": "error",
@@ -1,3 +1,8 @@
-from .agent import todo_agent
+__all__ = ['todo_agent']
 
-__all__ = ['todo_agent'] 
\ No newline at end of file
+
+def __getattr__(name):
+    if name == 'todo_agent':
+        from .agent import todo_agent
+        return todo_agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
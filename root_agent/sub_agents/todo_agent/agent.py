@@ -1,38 +1,25 @@
+from functools import lru_cache
+
 from google.adk.agents import Agent
 from google.adk.tools import FunctionTool
 from .tools.todo_tools import TodoTools
+from ...config import load_config
 from ...utils import get_logger
-import yaml
 
 logger = get_logger(__name__)
 
-with open("application.yaml", "r") as f:
-    config = yaml.safe_load(f)
-
-todo_tools = TodoTools(config)
-
-add_todo_tool = FunctionTool(func=todo_tools.add_todo)
-list_todos_tool = FunctionTool(func=todo_tools.list_todos)
-get_todo_tool = FunctionTool(func=todo_tools.get_todo)
-update_todo_tool = FunctionTool(func=todo_tools.update_todo)
-delete_todo_tool = FunctionTool(func=todo_tools.delete_todo)
-search_todos_tool = FunctionTool(func=todo_tools.search_todos)
-get_todo_statistics_tool = FunctionTool(func=todo_tools.get_todo_statistics)
-
-todo_agent = Agent(
-    name="todo_agent",
-    model=config.get("model", "gemini-2.0-flash"),
-    description="Keeps track of tasks you want to complete",
-    instruction="""
+_INSTRUCTION = """
     You are a Todo Agent. Your job is to manage user todo lists and tasks.
     You can perform the following operations on todo items:
     - Add a new todo item using `add_todo_tool`.
+    - Add several todo items at once using `add_todos_tool`; prefer it over repeated `add_todo_tool` calls when the user lists multiple tasks.
     - List todo items with optional filtering using `list_todos_tool`.
     - Get a specific todo item by ID using `get_todo_tool`.
     - Update an existing todo item using `update_todo_tool`.
     - Delete a todo item permanently using `delete_todo_tool`.
     - Search todo items by title or description using `search_todos_tool`.
     - Get statistics about todo items using `get_todo_statistics_tool`.
+    Todo lists and searches are paged. To show more, call the same tool again with `cursor` set to the `next_cursor` of the previous result; a null `next_cursor` means there are no more.
     Todos are optional, may or may not have a deadline, and require action (e.g., mark as complete).
     They can be recurring, but not always.
     Example: "Buy groceries this weekend"
@@ -44,14 +31,42 @@ todo_agent = Agent(
 
     If the user asks about reminders or alerts, escalate to the root agent by responding with: "ESCALATE_TO_ROOT: This is a reminder/alert request..."
     If the request is outside of your domain, escalate to the root agent by responding with: "ESCALATE_TO_ROOT: This request is outside my todo domain..."
-    """,
-    tools=[
-        add_todo_tool,
-        list_todos_tool,
-        get_todo_tool,
-        update_todo_tool,
-        delete_todo_tool,
-        search_todos_tool,
-        get_todo_statistics_tool
-    ]
-)
+    """
+
+
+@lru_cache(maxsize=1)
+def get_todo_tools() -> TodoTools:
+    """Create the shared TodoTools, and with it the database connection pool, on first use."""
+    return TodoTools(load_config())
+
+
+@lru_cache(maxsize=1)
+def get_todo_agent() -> Agent:
+    """Build the todo agent and its FunctionTools on first use."""
+    config = load_config()
+    todo_tools = get_todo_tools()
+    return Agent(
+        name="todo_agent",
+        model=config.get("model", "gemini-2.0-flash"),
+        description="Keeps track of tasks you want to complete",
+        instruction=_INSTRUCTION,
+        tools=[
+            FunctionTool(func=todo_tools.add_todo),
+            FunctionTool(func=todo_tools.add_todos),
+            FunctionTool(func=todo_tools.list_todos),
+            FunctionTool(func=todo_tools.get_todo),
+            FunctionTool(func=todo_tools.update_todo),
+            FunctionTool(func=todo_tools.delete_todo),
+            FunctionTool(func=todo_tools.search_todos),
+            FunctionTool(func=todo_tools.get_todo_statistics)
+        ]
+    )
+
+
+def __getattr__(name):
+    # PEP 562: `from .agent import todo_agent` builds the agent on first access
+    if name == 'todo_agent':
+        return get_todo_agent()
+    if name == 'todo_tools':
+        return get_todo_tools()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
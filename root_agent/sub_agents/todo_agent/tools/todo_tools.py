@@ -1,24 +1,21 @@
-from datetime import datetime
-from typing import List, Dict, Optional
-from pydantic import BaseModel, Field
+from __future__ import annotations
+
+from datetime import date
+from typing import Literal, Optional, get_args
 
 from db.connection import DatabaseConnection
 from db.repositories import TodoRepository
 
+# Literal parameter types become enums in the tool schemas, so the model can
+# only pick valid values
+Priority = Literal["low", "medium", "high"]
+Status = Literal["pending", "in_progress", "completed"]
 
-class TodoItem(BaseModel):
-    id: int = Field(..., description="Unique identifier for the todo item.")
-    title: str = Field(..., description="Short title for the todo item.")
-    description: Optional[str] = Field(None, description="Detailed description of the task.")
-    priority: str = Field("medium", description="Priority level of the todo item (low, medium, high).")
-    status: str = Field("pending", description="Current status of the todo item (pending, in_progress, completed).")
-    due_date: Optional[str] = Field(None, description="Optional due date for the task in YYYY-MM-DD format.")
-    created_at: str = Field(default_factory=lambda: datetime.now().strftime("%Y-%m-%d %H:%M:%S"), description="Timestamp when the todo item was created.")
-    completed_at: Optional[str] = Field(None, description="Timestamp when the todo item was marked as completed.")
+_PRIORITIES = get_args(Priority)
 
 
 class TodoTools:
-    def __init__(self, config: Dict):
+    def __init__(self, config: dict):
         """
         Initialize TodoTools with database connection.
         
@@ -28,26 +25,62 @@ class TodoTools:
         self.config = config
         self.db_connection = DatabaseConnection(config.get('database', {}))
         self.db_connection.connect()
+        # Bound once to the thread-local session registry: inside session_scope()
+        # it resolves to the session that scope commits and closes
+        self.repository = TodoRepository(self.db_connection.ScopedSession)
 
-    def _parse_due_date(self, due_date: str) -> Optional[datetime]:
+    def _parse_due_date(self, due_date: str) -> Optional[date]:
         """
-        Parse due_date string into datetime object.
+        Parse due_date string into date object.
         
         Args:
             due_date: Date string in YYYY-MM-DD format
         
         Returns:
-            datetime: Parsed datetime object or None if invalid
+            date: Parsed date object or None if invalid
         """
         if not due_date:
             return None
         
         try:
-            return datetime.strptime(due_date, "%Y-%m-%d")
+            return date.fromisoformat(due_date)
         except ValueError:
             return None
 
-    def add_todo(self, title: Optional[str] = None, description: Optional[str] = None, priority: Optional[str] = None, due_date: Optional[str] = None) -> Dict:
+    def _build_todo(self, title: Optional[str], description: Optional[str],
+                    priority: Optional[str], due_date: Optional[str]) -> dict:
+        """
+        Validate add_todo arguments and fill in the generated title and default priority.
+        
+        Returns:
+            dict: title, description, priority and parsed due_date for the repository
+        
+        Raises:
+            ValueError: With a user-facing message if the arguments are invalid
+        """
+        if not description:
+            raise ValueError("Description is required to add a todo item.")
+
+        if not title:
+            # Only the first five words are needed; the sixth (if any) holds the rest
+            words = description.split(maxsplit=5)
+            title = ' '.join(words[:5])
+            if len(words) > 5:
+                title += '...'
+
+        if priority is None:
+            priority = self.config.get("default_todo_priority", "medium")
+        elif priority not in _PRIORITIES:
+            raise ValueError("Invalid priority. Please choose from 'low', 'medium', or 'high'.")
+        
+        return {
+            "title": title,
+            "description": description,
+            "priority": priority,
+            "due_date": self._parse_due_date(due_date) if due_date else None
+        }
+
+    def add_todo(self, title: Optional[str] = None, description: Optional[str] = None, priority: Optional[Priority] = None, due_date: Optional[str] = None) -> dict:
         """
         Add a new todo item to the list.
         Args:
@@ -59,74 +92,89 @@ class TodoTools:
             dict: Status and todo item details
         """
         try:
-            if not description:
-                return {
-                    "status": "error",
-                    "message": "Description is required to add a todo item."
-                }
-
-            if not title:
-                title = ' '.join(description.split()[:5])
-                if len(description.split()) > 5:
-                    title += '...'
-
-            if priority is None:
-                priority = self.config.get("default_todo_priority", "medium")
-            elif priority not in ["low", "medium", "high"]:
+            try:
+                todo = self._build_todo(title, description, priority, due_date)
+            except ValueError as e:
                 return {
                     "status": "error",
-                    "message": "Invalid priority. Please choose from 'low', 'medium', or 'high'."
+                    "message": str(e)
                 }
             
-            parsed_due_date = self._parse_due_date(due_date) if due_date else None
-            
-            session = self.db_connection.get_session()
-            if not session:
-                return {
-                    "status": "error",
-                    "message": "Database connection failed"
-                }
-            
-            repository = TodoRepository(session)
-            result = repository.add_todo(title, description, priority, parsed_due_date)
-            session.close()
-            
-            return result
+            with self.db_connection.session_scope():
+                return self.repository.add_todo(**todo)
+        except ConnectionError:
+            return {
+                "status": "error",
+                "message": "Database connection failed"
+            }
         except Exception as e:
             return {
                 "status": "error",
                 "message": f"Failed to add todo item: {str(e)}"
             }
 
-    def list_todos(self, filter_status: Optional[str] = None, filter_priority: Optional[str] = None) -> Dict:
+    def add_todos(self, todos: list[dict]) -> dict:
+        """
+        Add several todo items at once, in one session and a single INSERT.
+        Use this instead of repeated add_todo calls when the user lists multiple tasks.
+        Args:
+            todos: Dicts with description and optional title, priority and due_date (same formats as add_todo)
+        Returns:
+            dict: Status and number of todo items added
+        """
+        try:
+            rows = []
+            for number, item in enumerate(todos, 1):
+                try:
+                    rows.append(self._build_todo(
+                        item.get("title"), item.get("description"), item.get("priority"), item.get("due_date")
+                    ))
+                except ValueError as e:
+                    return {
+                        "status": "error",
+                        "message": f"Todo item {number}: {str(e)} No todo items were added."
+                    }
+            
+            with self.db_connection.session_scope():
+                return self.repository.add_todos_bulk(rows)
+        except ConnectionError:
+            return {
+                "status": "error",
+                "message": "Database connection failed"
+            }
+        except Exception as e:
+            return {
+                "status": "error",
+                "message": f"Failed to add todo items: {str(e)}"
+            }
+
+    def list_todos(self, filter_status: Optional[Status] = None, filter_priority: Optional[Priority] = None,
+                   cursor: Optional[str] = None, limit: int = 25) -> dict:
         """
-        List todo items with optional filtering.
+        List todo items with optional filtering, newest first, one page at a time.
         Args:
             filter_status: Filter by status (pending, in_progress, completed)
             filter_priority: Filter by priority (low, medium, high)
+            cursor: next_cursor from the previous page, to show more (optional)
+            limit: Maximum number of todo items to return (default 25)
         Returns:
-            dict: List of todo items
+            dict: Page of todo items; next_cursor is null on the last page
         """
         try:
-            session = self.db_connection.get_session()
-            if not session:
-                return {
-                    "status": "error",
-                    "message": "Database connection failed"
-                }
-            
-            repository = TodoRepository(session)
-            result = repository.list_todos(filter_status, filter_priority)
-            session.close()
-            
-            return result
+            with self.db_connection.session_scope():
+                return self.repository.list_todos(filter_status, filter_priority, cursor, limit)
+        except ConnectionError:
+            return {
+                "status": "error",
+                "message": "Database connection failed"
+            }
         except Exception as e:
             return {
                 "status": "error",
                 "message": f"Failed to list todos: {str(e)}"
             }
 
-    def get_todo(self, todo_id: int) -> Dict:
+    def get_todo(self, todo_id: int) -> dict:
         """
         Get a specific todo item by ID.
         Args:
@@ -135,18 +183,13 @@ class TodoTools:
             dict: Todo item details or error message
         """
         try:
-            session = self.db_connection.get_session()
-            if not session:
-                return {
-                    "status": "error",
-                    "message": "Database connection failed"
-                }
-            
-            repository = TodoRepository(session)
-            result = repository.get_todo(todo_id)
-            session.close()
-            
-            return result
+            with self.db_connection.session_scope():
+                return self.repository.get_todo(todo_id)
+        except ConnectionError:
+            return {
+                "status": "error",
+                "message": "Database connection failed"
+            }
         except Exception as e:
             return {
                 "status": "error",
@@ -154,8 +197,8 @@ class TodoTools:
             }
 
     def update_todo(self, todo_id: int, title: Optional[str] = None, description: Optional[str] = None, 
-                    priority: Optional[str] = None, status: Optional[str] = None, 
-                    due_date: Optional[str] = None) -> Dict:
+                    priority: Optional[Priority] = None, status: Optional[Status] = None, 
+                    due_date: Optional[str] = None) -> dict:
         """
         Update an existing todo item.
         Args:
@@ -171,25 +214,20 @@ class TodoTools:
         try:
             parsed_due_date = self._parse_due_date(due_date) if due_date else None
             
-            session = self.db_connection.get_session()
-            if not session:
-                return {
-                    "status": "error",
-                    "message": "Database connection failed"
-                }
-            
-            repository = TodoRepository(session)
-            result = repository.update_todo(todo_id, title, description, priority, status, parsed_due_date)
-            session.close()
-            
-            return result
+            with self.db_connection.session_scope():
+                return self.repository.update_todo(todo_id, title, description, priority, status, parsed_due_date)
+        except ConnectionError:
+            return {
+                "status": "error",
+                "message": "Database connection failed"
+            }
         except Exception as e:
             return {
                 "status": "error",
                 "message": f"Failed to update todo item: {str(e)}"
             }
 
-    def delete_todo(self, todo_id: int) -> Dict:
+    def delete_todo(self, todo_id: int) -> dict:
         """
         Delete a todo item permanently.
         Args:
@@ -198,70 +236,57 @@ class TodoTools:
             dict: Deletion status
         """
         try:
-            session = self.db_connection.get_session()
-            if not session:
-                return {
-                    "status": "error",
-                    "message": "Database connection failed"
-                }
-            
-            repository = TodoRepository(session)
-            result = repository.delete_todo(todo_id)
-            session.close()
-            
-            return result
+            with self.db_connection.session_scope():
+                return self.repository.delete_todo(todo_id)
+        except ConnectionError:
+            return {
+                "status": "error",
+                "message": "Database connection failed"
+            }
         except Exception as e:
             return {
                 "status": "error",
                 "message": f"Failed to delete todo item: {str(e)}"
             }
 
-    def search_todos(self, query: str) -> Dict:
+    def search_todos(self, query: str, cursor: Optional[str] = None, limit: int = 25) -> dict:
         """
-        Search todo items by title or description.
+        Search todo items by title or description, newest first, one page at a time.
         Args:
             query: Search query
+            cursor: next_cursor from the previous page, to show more (optional)
+            limit: Maximum number of todo items to return (default 25)
         Returns:
-            dict: List of matching todo items
+            dict: Page of matching todo items; next_cursor is null on the last page
         """
         try:
-            session = self.db_connection.get_session()
-            if not session:
-                return {
-                    "status": "error",
-                    "message": "Database connection failed"
-                }
-            
-            repository = TodoRepository(session)
-            result = repository.search_todos(query)
-            session.close()
-            
-            return result
+            with self.db_connection.session_scope():
+                return self.repository.search_todos(query, cursor, limit)
+        except ConnectionError:
+            return {
+                "status": "error",
+                "message": "Database connection failed"
+            }
         except Exception as e:
             return {
                 "status": "error",
                 "message": f"Failed to search todos: {str(e)}"
             }
 
-    def get_todo_statistics(self) -> Dict:
+    def get_todo_statistics(self) -> dict:
         """
         Get statistics about todo items.
         Returns:
             dict: Various statistics about todo items
         """
         try:
-            session = self.db_connection.get_session()
-            if not session:
-                return {
-                    "status": "error",
-                    "message": "Database connection failed"
-                }
-            
-            repository = TodoRepository(session)
-            result = repository.get_todo_statistics()
-            session.close()
-            
-            return result
+            with self.db_connection.session_scope():
+                return self.repository.get_todo_statistics()
+        except ConnectionError:
+            return {
+                "status": "error",
+                "message": "Database connection failed"
+            }
         except Exception as e:
             return {
                 "status": "error",
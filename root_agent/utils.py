@@ -1,15 +1,36 @@
+import atexit
 import logging
-import yaml
+import logging.handlers
+import queue
+from functools import lru_cache
 
-with open("application.yaml", "r") as f:
-    config = yaml.safe_load(f)
+from .config import load_config
+
+
+config = load_config()
 
 log_level = config.get("log_level", "INFO").upper()
 
+# Records are queued by the calling thread and formatted and written by a
+# listener thread, keeping timestamp formatting and stream I/O off tool calls
+_log_queue = queue.SimpleQueue()
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%H:%M:%S",
+))
+_listener = logging.handlers.QueueListener(_log_queue, _stream_handler)
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+# Only merge args into the message here; the listener applies the full format
+_queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
 logging.basicConfig(
     level=log_level,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    handlers=[_queue_handler],
 )
+_listener.start()
+atexit.register(_listener.stop)
 
+@lru_cache(maxsize=None)
 def get_logger(name):
     return logging.getLogger(name)
@@ -7,16 +7,24 @@ Installs dependencies and initializes the database.
 import subprocess
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
-def run_command(command, description):
-    """Run a command and handle errors."""
+def run_command(command, description, stdin_path=None):
+    """Run a command (argv list, no shell) and handle errors."""
     print(f"🔄 {description}...")
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
+        if stdin_path:
+            with open(stdin_path, "r") as stdin:
+                subprocess.run(command, stdin=stdin, check=True, capture_output=True, text=True)
+        else:
+            subprocess.run(command, check=True, capture_output=True, text=True)
         print(f"✅ {description} completed successfully")
         return True
+    except FileNotFoundError as e:
+        print(f"❌ {description} failed: {e}")
+        return False
     except subprocess.CalledProcessError as e:
         print(f"❌ {description} failed: {e}")
         if e.stdout:
@@ -35,25 +43,23 @@ def check_python_version():
     return True
 
 
-def install_dependencies():
+def install_dependencies(has_uv):
     """Install Python dependencies using uv."""
-    # Check if uv is available
-    if not run_command("uv --version", "Checking for uv"):
+    if not has_uv:
         print("❌ uv is not installed. Please install uv first:")
         print("   curl -LsSf https://astral.sh/uv/install.sh | sh")
         return False
     
     # Install dependencies using uv add
-    return run_command("uv add mysql-connector-python sqlalchemy", "Installing dependencies with uv")
+    return run_command(["uv", "add", "mysql-connector-python", "sqlalchemy"], "Installing dependencies with uv")
 
 
-def setup_database():
+def setup_database(has_mysql):
     """Set up the database."""
     print("\n🗄️  Database Setup")
     print("=" * 50)
     
-    # Check if MySQL client is available
-    if not run_command("mysql --version", "Checking MySQL client"):
+    if not has_mysql:
         print("⚠️  MySQL client not found. Please install MySQL client tools.")
         print("   You can still run the application, but database setup will need to be done manually.")
         return True
@@ -66,7 +72,8 @@ def setup_database():
         return True
     
     # Run database schema
-    if run_command("mysql -h 192.168.0.111 -u admin -p heptapal-db < database_schema.sql", "Creating database tables"):
+    if run_command(["mysql", "-h", "192.168.0.111", "-u", "admin", "-p", "heptapal-db"], "Creating database tables",
+                   stdin_path="database_schema.sql"):
         print("✅ Database setup completed")
         return True
     else:
@@ -80,12 +87,34 @@ def test_setup():
     print("\n🧪 Testing Setup")
     print("=" * 50)
     
-    if run_command("python test_database.py", "Running database tests"):
-        print("✅ All tests passed!")
-        return True
-    else:
-        print("❌ Some tests failed. Please check the error messages above.")
+    # pytest lives in the dev dependency group, which uv installs on demand;
+    # -rs lists skip reasons in the summary
+    command = ["uv", "run", "--group", "dev", "pytest", "-q", "-rs", "test_database.py"]
+    print("🔄 Running database tests...")
+    try:
+        result = subprocess.run(command, capture_output=True, text=True)
+    except FileNotFoundError as e:
+        print(f"❌ Running database tests failed: {e}")
+        return False
+    
+    lines = result.stdout.strip().splitlines()
+    summary = lines[-1] if lines else ""
+    if result.returncode != 0:
+        print("❌ Some tests failed. Please check the error messages below.")
+        print(result.stdout)
+        if result.stderr:
+            print(f"   stderr: {result.stderr}")
         return False
+    
+    # The tests skip themselves when the database is unreachable, which
+    # pytest still reports as success
+    if "passed" not in summary:
+        print("❌ No database tests ran. Please check your database connection.")
+        print(result.stdout)
+        return False
+    
+    print(f"✅ All tests passed! ({summary.strip('= ')})")
+    return True
 
 
 def main():
@@ -97,13 +126,22 @@ def main():
     if not check_python_version():
         sys.exit(1)
     
+    # The uv and MySQL client checks are independent, so probe both at once
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        uv_check = executor.submit(run_command, ["uv", "--version"], "Checking for uv")
+        mysql_check = executor.submit(run_command, ["mysql", "--version"], "Checking MySQL client")
+        has_uv, has_mysql = uv_check.result(), mysql_check.result()
+    
     # Install dependencies
-    if not install_dependencies():
+    if not install_dependencies(has_uv):
         print("❌ Failed to install dependencies")
         sys.exit(1)
     
+    # Pre-parse application.yaml so the agents start without loading PyYAML
+    run_command([sys.executable, "-m", "root_agent.config"], "Compiling configuration")
+    
     # Setup database
-    if not setup_database():
+    if not setup_database(has_mysql):
         print("❌ Failed to setup database")
         sys.exit(1)
     
@@ -0,0 +1,59 @@
+"""
+Tests for the async repositories, against an aiosqlite database.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+pytest.importorskip("greenlet")
+
+from db.async_connection import AsyncDatabaseConnection
+from db.async_repositories import AsyncReminderRepository, AsyncTodoRepository
+from db.models import Base
+
+
+async def _exercise_async_repositories(url):
+    db_connection = AsyncDatabaseConnection({"url": url})
+    assert await db_connection.connect()
+    try:
+        await db_connection.create_tables(Base)
+        reminder_repository = AsyncReminderRepository(db_connection)
+        todo_repository = AsyncTodoRepository(db_connection)
+        
+        # Adds run on separate sessions, so they can be awaited together
+        reminder_result, todo_result = await asyncio.gather(
+            reminder_repository.add_reminder(
+                "Async Reminder", "Added through the async repository", datetime.now() + timedelta(hours=1)
+            ),
+            todo_repository.add_todo("Async Todo", "Added through the async repository", "high")
+        )
+        assert reminder_result["status"] == "success", reminder_result["message"]
+        assert todo_result["status"] == "success", todo_result["message"]
+        reminder_id = reminder_result["reminder"]["id"]
+        todo_id = todo_result["todo"]["id"]
+        
+        reminders, todos = await asyncio.gather(
+            reminder_repository.list_reminders(),
+            todo_repository.list_todos()
+        )
+        assert [r["id"] for r in reminders["reminders"]] == [reminder_id]
+        assert [t["id"] for t in todos["todos"]] == [todo_id]
+        
+        update_result = await todo_repository.update_todo(todo_id, status="completed")
+        assert update_result["status"] == "success", update_result["message"]
+        assert update_result["todo"]["status"] == "completed"
+        
+        delete_result = await reminder_repository.delete_reminder(reminder_id)
+        assert delete_result["status"] == "success", delete_result["message"]
+        assert (await reminder_repository.count_active_reminders())["count"] == 0
+    finally:
+        await db_connection.close()
+
+
+def test_async_repositories(tmp_path):
+    """Test async reminder and todo operations, including concurrent calls."""
+    # A file database, so concurrent sessions each get their own connection
+    asyncio.run(_exercise_async_repositories(f"sqlite+aiosqlite:///{tmp_path / 'async.db'}"))
@@ -1,215 +1,157 @@
-#!/usr/bin/env python3
 """
-Test script to verify database functionality for Heptapal Agent Core.
+Tests for the database functionality of Heptapal Agent Core.
 """
 
-import yaml
-import logging
 from datetime import datetime, timedelta
 
-from db.connection import DatabaseConnection
 from db.repositories import ReminderRepository, TodoRepository
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
 
+def _exercise_crud(repository, n=10):
+    """
+    Add, update and delete n reminders with one statement per step.
+    
+    The bulk insert returns no ids (MySQL has no INSERT ... RETURNING), so
+    the batch is found again by the unique title it was given; the update
+    and delete then hit every row at once by id IN.
+    """
+    marker = f"Batch CRUD {datetime.now().timestamp()}"
+    remind_time = datetime.now() + timedelta(hours=1)
+    bulk_result = repository.add_reminders_bulk([
+        {"title": marker, "description": f"Batch reminder {i}", "remind_time": remind_time}
+        for i in range(n)
+    ])
+    assert bulk_result["status"] == "success", bulk_result["message"]
+    assert bulk_result["count"] == n
+    
+    ids = [r["id"] for r in repository.search_reminders(marker)["reminders"]]
+    assert len(ids) == n
+    
+    update_result = repository.update_reminders(ids, title=f"{marker} updated")
+    assert update_result["status"] == "success", update_result["message"]
+    assert update_result["count"] == n
+    updated = repository.search_reminders(f"{marker} updated")["reminders"]
+    assert sorted(r["id"] for r in updated) == sorted(ids)
+    
+    delete_result = repository.delete_reminders(ids)
+    assert delete_result["status"] == "success", delete_result["message"]
+    assert delete_result["count"] == n
+    
+    # Deleting only deactivates: the batch drops out of search, and a second
+    # delete finds nothing left to deactivate
+    assert repository.search_reminders(marker)["reminders"] == []
+    assert repository.delete_reminders(ids)["count"] == 0
 
-def load_config():
-    """Load application configuration."""
-    with open("application.yaml", "r") as f:
-        return yaml.safe_load(f)
 
-
-def test_database_connection():
+def test_database_connection(db_connection):
     """Test database connection."""
-    print("🔌 Testing database connection...")
-    
-    config = load_config()
-    db_config = config.get('database', {})
-    
-    db_connection = DatabaseConnection(db_config)
-    
-    if db_connection.connect():
-        print("✅ Database connection successful")
-        return db_connection
-    else:
-        print("❌ Database connection failed")
-        return None
+    assert db_connection.test_connection()
 
 
-def test_reminder_operations(db_connection):
+def test_reminder_operations(db_session):
     """Test reminder operations."""
-    print("\n📅 Testing reminder operations...")
-    
-    session = db_connection.get_session()
-    if not session:
-        print("❌ Failed to get database session")
-        return
-    
-    repository = ReminderRepository(session)
-    
-    try:
-        # Test adding a reminder
-        print("  Adding reminder...")
-        result = repository.add_reminder(
-            title="Test Meeting",
-            description="This is a test reminder for database functionality",
-            remind_time=datetime.now() + timedelta(hours=1)
-        )
-        
-        if result["status"] == "success":
-            print("  ✅ Reminder added successfully")
-            reminder_id = result["reminder"]["id"]
-            
-            # Test getting the reminder
-            print("  Getting reminder...")
-            get_result = repository.get_reminder(reminder_id)
-            if get_result["status"] == "success":
-                print("  ✅ Reminder retrieved successfully")
-            
-            # Test listing reminders
-            print("  Listing reminders...")
-            list_result = repository.list_reminders()
-            if list_result["status"] == "success":
-                print(f"  ✅ Found {len(list_result['reminders'])} reminders")
-            
-            # Test searching reminders
-            print("  Searching reminders...")
-            search_result = repository.search_reminders("test")
-            if search_result["status"] == "success":
-                print(f"  ✅ Found {len(search_result['reminders'])} matching reminders")
-            
-            # Test updating reminder
-            print("  Updating reminder...")
-            update_result = repository.update_reminder(
-                reminder_id, 
-                title="Updated Test Meeting"
-            )
-            if update_result["status"] == "success":
-                print("  ✅ Reminder updated successfully")
-            
-            # Test deleting reminder
-            print("  Deleting reminder...")
-            delete_result = repository.delete_reminder(reminder_id)
-            if delete_result["status"] == "success":
-                print("  ✅ Reminder deleted successfully")
-        
-        else:
-            print(f"  ❌ Failed to add reminder: {result['message']}")
-    
-    except Exception as e:
-        print(f"  ❌ Error during reminder operations: {str(e)}")
-    
-    finally:
-        session.close()
+    repository = ReminderRepository(db_session)
+    
+    # Test adding a reminder
+    result = repository.add_reminder(
+        title="Test Meeting",
+        description="This is a test reminder for database functionality",
+        remind_time=datetime.now() + timedelta(hours=1)
+    )
+    assert result["status"] == "success", result["message"]
+    reminder_id = result["reminder"]["id"]
+    
+    # Test getting the reminder
+    get_result = repository.get_reminder(reminder_id)
+    assert get_result["status"] == "success", get_result["message"]
+    assert get_result["reminder"]["title"] == "Test Meeting"
+    
+    # Test listing reminders
+    list_result = repository.list_reminders()
+    assert list_result["status"] == "success", list_result["message"]
+    
+    # Test searching reminders
+    search_result = repository.search_reminders("test")
+    assert search_result["status"] == "success", search_result["message"]
+    assert reminder_id in [r["id"] for r in search_result["reminders"]]
+    
+    # Test updating reminder
+    update_result = repository.update_reminder(
+        reminder_id,
+        title="Updated Test Meeting"
+    )
+    assert update_result["status"] == "success", update_result["message"]
+    assert update_result["reminder"]["title"] == "Updated Test Meeting"
+    
+    # Test deleting reminder
+    delete_result = repository.delete_reminder(reminder_id)
+    assert delete_result["status"] == "success", delete_result["message"]
 
 
-def test_todo_operations(db_connection):
-    """Test todo operations."""
-    print("\n📝 Testing todo operations...")
-    
-    session = db_connection.get_session()
-    if not session:
-        print("❌ Failed to get database session")
-        return
-    
-    repository = TodoRepository(session)
-    
-    try:
-        # Test adding a todo
-        print("  Adding todo...")
-        result = repository.add_todo(
-            title="Test Task",
-            description="This is a test todo for database functionality",
-            priority="high",
-            due_date=datetime.now() + timedelta(days=1)
-        )
-        
-        if result["status"] == "success":
-            print("  ✅ Todo added successfully")
-            todo_id = result["todo"]["id"]
-            
-            # Test getting the todo
-            print("  Getting todo...")
-            get_result = repository.get_todo(todo_id)
-            if get_result["status"] == "success":
-                print("  ✅ Todo retrieved successfully")
-            
-            # Test listing todos
-            print("  Listing todos...")
-            list_result = repository.list_todos()
-            if list_result["status"] == "success":
-                print(f"  ✅ Found {len(list_result['todos'])} todos")
-            
-            # Test filtering todos
-            print("  Filtering todos by priority...")
-            filter_result = repository.list_todos(filter_priority="high")
-            if filter_result["status"] == "success":
-                print(f"  ✅ Found {len(filter_result['todos'])} high priority todos")
-            
-            # Test searching todos
-            print("  Searching todos...")
-            search_result = repository.search_todos("test")
-            if search_result["status"] == "success":
-                print(f"  ✅ Found {len(search_result['todos'])} matching todos")
-            
-            # Test updating todo
-            print("  Updating todo...")
-            update_result = repository.update_todo(
-                todo_id, 
-                title="Updated Test Task",
-                status="in_progress"
-            )
-            if update_result["status"] == "success":
-                print("  ✅ Todo updated successfully")
-            
-            # Test getting statistics
-            print("  Getting todo statistics...")
-            stats_result = repository.get_todo_statistics()
-            if stats_result["status"] == "success":
-                print("  ✅ Todo statistics retrieved successfully")
-                print(f"     Total: {stats_result['statistics']['total']}")
-                print(f"     Pending: {stats_result['statistics']['pending']}")
-                print(f"     In Progress: {stats_result['statistics']['in_progress']}")
-                print(f"     Completed: {stats_result['statistics']['completed']}")
-            
-            # Test deleting todo
-            print("  Deleting todo...")
-            delete_result = repository.delete_todo(todo_id)
-            if delete_result["status"] == "success":
-                print("  ✅ Todo deleted successfully")
-        
-        else:
-            print(f"  ❌ Failed to add todo: {result['message']}")
-    
-    except Exception as e:
-        print(f"  ❌ Error during todo operations: {str(e)}")
-    
-    finally:
-        session.close()
+def test_reminder_batch_operations(db_session):
+    """Test bulk-added reminders through update and delete."""
+    _exercise_crud(ReminderRepository(db_session))
 
 
-def main():
-    """Main test function."""
-    print("🚀 Starting database functionality test...")
-    
-    # Test database connection
-    db_connection = test_database_connection()
-    if not db_connection:
-        return
-    
-    # Test reminder operations
-    test_reminder_operations(db_connection)
-    
-    # Test todo operations
-    test_todo_operations(db_connection)
-    
-    # Close database connection
-    db_connection.close()
-    
-    print("\n🎉 Database functionality test completed!")
-
-
-if __name__ == "__main__":
-    main() 
\ No newline at end of file
+def test_todo_operations(db_session):
+    """Test todo operations."""
+    repository = TodoRepository(db_session)
+    stats_before = repository.get_todo_statistics()["statistics"]
+    
+    # Test adding a todo
+    result = repository.add_todo(
+        title="Test Task",
+        description="This is a test todo for database functionality",
+        priority="high",
+        due_date=(datetime.now() + timedelta(days=1)).date()
+    )
+    assert result["status"] == "success", result["message"]
+    todo_id = result["todo"]["id"]
+    
+    # Test getting the todo
+    get_result = repository.get_todo(todo_id)
+    assert get_result["status"] == "success", get_result["message"]
+    assert get_result["todo"]["priority"] == "high"
+    
+    # Test listing todos; newest first, so the new todo is on the first page
+    list_result = repository.list_todos()
+    assert list_result["status"] == "success", list_result["message"]
+    assert todo_id in [t["id"] for t in list_result["todos"]]
+    
+    # Test filtering todos
+    filter_result = repository.list_todos(filter_priority="high")
+    assert filter_result["status"] == "success", filter_result["message"]
+    assert all(t["priority"] == "high" for t in filter_result["todos"])
+    assert todo_id in [t["id"] for t in filter_result["todos"]]
+    
+    # Test searching todos
+    search_result = repository.search_todos("test")
+    assert search_result["status"] == "success", search_result["message"]
+    assert todo_id in [t["id"] for t in search_result["todos"]]
+    
+    # Test updating todo
+    update_result = repository.update_todo(
+        todo_id,
+        title="Updated Test Task",
+        status="in_progress"
+    )
+    assert update_result["status"] == "success", update_result["message"]
+    assert update_result["todo"]["status"] == "in_progress"
+    
+    # Test getting statistics
+    stats_result = repository.get_todo_statistics()
+    assert stats_result["status"] == "success", stats_result["message"]
+    # The database may hold other todos, so compare against the counts
+    # before this test plus the one in-progress, high-priority todo
+    expected = dict(
+        stats_before,
+        total=stats_before["total"] + 1,
+        in_progress=stats_before["in_progress"] + 1,
+        high_priority=stats_before["high_priority"] + 1
+    )
+    assert stats_result["statistics"] == expected
+    
+    # Test deleting todo
+    delete_result = repository.delete_todo(todo_id)
+    assert delete_result["status"] == "success", delete_result["message"]
+    assert repository.get_todo(todo_id)["status"] == "error"